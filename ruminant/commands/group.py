@@ -295,7 +295,7 @@ def generate_group_summary(group: str, year: int, week: int, config, claude_args
     cmd_args = claude_args if claude_args else config.claude.args
     
     # Run Claude CLI
-    claude_result = run_claude_cli(prompt_file, config.claude.command, cmd_args, log_file)
+    claude_result = run_claude_cli(prompt_file, config.claude.command, cmd_args, log_file, content_only=True)
     
     if not claude_result["success"]:
         if claude_result.get("timeout"):
@@ -69,7 +69,7 @@ def generate_summary(repo: str, year: int, week: int, config, claude_args: Optio
                 time.sleep(2)  # Brief delay between retries
             
             # Run Claude CLI with logging
-            claude_result = run_claude_cli(prompt_file, config.claude.command, cmd_args, log_file)
+            claude_result = run_claude_cli(prompt_file, config.claude.command, cmd_args, log_file, content_only=True)
             
             # Check for timeout
             if claude_result.get("timeout", False):
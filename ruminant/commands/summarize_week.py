@@ -535,7 +535,8 @@ def summarize_week_main(
             prompt_file=prompt_file,
             claude_command=claude_command,
             claude_args=claude_base_args,
-            log_file=log_file
+            log_file=log_file,
+            content_only=True
         )
 
         if not result["success"]:
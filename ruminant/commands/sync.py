@@ -8,14 +8,16 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from ..config import load_config, get_github_token
 from ..utils.dates import get_last_complete_week, get_week_list, get_week_date_range
-from ..utils.paths import get_cache_file_path, ensure_repo_dirs, parse_repo
+from ..utils.paths import get_cache_file_path, ensure_repo_dirs, ensure_all_repo_dirs, parse_repo
 from pathlib import Path
 import glob as glob_module
 from ..utils.logging import (
     success, error, warning, info, step, summary_table, operation_summary,
     repo_progress, print_repo_list
 )
-from ..utils.github import fetch_issues, fetch_discussions, extract_users_from_data, fetch_user_info, fetch_releases
+from ..utils.github import (
+    fetch_issues, fetch_discussions, extract_users_from_data, fetch_user_info, fetch_users_batch, fetch_releases
+)
 
 def load_week_cache(repo: str, year: int, week: int, max_age_hours: int = 24) -> Optional[dict]:
     """Load cached data for a specific repo and week."""
@@ -117,19 +119,25 @@ def save_user_data(users: set, token: Optional[str]) -> dict:
     user_dir.mkdir(parents=True, exist_ok=True)
     
     fetched = 0
-    skipped = 0
     failed = 0
     
-    for username in users:
+    # Skip users whose data already exists
+    to_fetch = [username for username in users if not (user_dir / f"{username}.json").exists()]
+    skipped = len(users) - len(to_fetch)
+    
+    # Look users up 100 per GraphQL request when we have a token
+    users_batch = fetch_users_batch(to_fetch, token) if token and to_fetch else {}
+    
+    for username in to_fetch:
         user_file = user_dir / f"{username}.json"
         
-        # Skip if user data already exists
-        if user_file.exists():
-            skipped += 1
-            continue
-        
-        # Fetch user data from GitHub
-        user_data = fetch_user_info(username, token)
+        # Fetch user data from GitHub, one at a time if the batch missed it
+        if username in users_batch:
+            user_data = users_batch[username]
+            if user_data is None:
+                warning(f"User {username} not found")
+        else:
+            user_data = fetch_user_info(username, token)
         if user_data:
             try:
                 with open(user_file, 'w', encoding='utf-8') as f:
@@ -397,9 +405,13 @@ def sync_main(
         all_users = set()
         total_operations = len(repositories_to_sync) * len(week_list)
         
-        # Use ThreadPoolExecutor for concurrent repository processing
-        # Limit workers to avoid overwhelming GitHub API rate limits
-        max_workers = min(2, len(repositories_to_sync))  # Process up to 2 repos concurrently to reduce 403 errors
+        # Create every repository's directories up front, sharing the parents
+        ensure_all_repo_dirs(repositories_to_sync)
+        
+        # Use ThreadPoolExecutor for concurrent repository processing. GraphQL
+        # requests in flight are capped across all of them by the GitHub
+        # client, and rate limited requests back off and retry
+        max_workers = min(8, len(repositories_to_sync))
         
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit all sync operations
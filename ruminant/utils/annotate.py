@@ -1,35 +1,113 @@
 """Annotation utilities adapted from annotate.py."""
 
+import io
 import json
+import os
 import re
 import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Set
-import uuid
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, Iterable, List, Optional, Set
+from urllib3.util.retry import Retry
 
+from . import jsonio
+from .github import fetch_users_batch
 from .logging import warning, error, info
 
 
 # Cache directory for user data
 USERS_CACHE_DIR = Path("data") / "users"
 
+# Shared HTTP session so user lookups reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept": "application/vnd.github.v3+json"})
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503]),
+)
+_SESSION.mount("http://", _adapter)
+_SESSION.mount("https://", _adapter)
+
+# Full names resolved during this run, keyed by username (misses included)
+_user_names: Dict[str, str] = {}
+
+# Seconds a cached "user not found" result is trusted before asking GitHub again
+NOT_FOUND_TTL = 1800
+
+# Days a cached user is trusted before it is revalidated against GitHub
+USER_CACHE_MAX_AGE_DAYS = 7
+
+# Users GitHub reported as missing, mapped to when that was seen. Kept out of
+# USERS_CACHE_DIR, whose files other commands read as real user profiles.
+NOT_FOUND_CACHE_FILE = Path("data") / "users-not-found.json"
+_NOT_FOUND: Optional[Dict[str, float]] = None
+_NOT_FOUND_LOCK = threading.Lock()
+
+# Usernames with a cache file on disk, read lazily from one directory listing
+_CACHED_USERS: Optional[Set[str]] = None
+
+# @username references
+USERNAME_PATTERN = re.compile(r'@([a-zA-Z0-9](?:[a-zA-Z0-9\-]*[a-zA-Z0-9])?)')
+# Every reference add_github_links rewrites, as one alternation so the text is
+# scanned once. Existing links are matched first and returned unchanged, then
+# user/repo#1234, @username, and #1234 (not preceded by /, to skip URLs).
+REFERENCE_PATTERN = re.compile(
+    r'(?P<link>\[[^\]]+\]\([^)]+\))'
+    r'|(?P<full_issue>\b(?P<full_repo>[a-zA-Z0-9][a-zA-Z0-9\-]*[a-zA-Z0-9]/[a-zA-Z0-9][a-zA-Z0-9\-_.]*[a-zA-Z0-9])'
+    r'#(?P<full_number>\d+)\b)'
+    r'|@(?P<user>[a-zA-Z0-9](?:[a-zA-Z0-9\-]*[a-zA-Z0-9])?)'
+    r'|(?<!/)#(?P<issue>\d+)\b'
+)
+# Body of the "## Contributors" section, up to the next heading
+CONTRIBUTORS_SECTION_PATTERN = re.compile(r'## Contributors\s*\n(.*?)(?=\n##|\Z)', re.DOTALL)
+# Markdown links pointing at github.com
+GITHUB_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(https://github\.com/([^)]+)\)')
+
 
 def ensure_users_dir():
     """Ensure the users cache directory exists."""
     USERS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _scan_user_cache() -> List[os.DirEntry]:
+    """List the user cache files with a single directory read.
+    
+    The returned entries cache their stat() result, so callers that need file
+    sizes do not issue a separate lookup per path.
+    """
+    try:
+        with os.scandir(USERS_CACHE_DIR) as entries:
+            return [entry for entry in entries if entry.name.endswith('.json')]
+    except FileNotFoundError:
+        return []
+
+
+def _cached_users() -> Set[str]:
+    """Return the set of usernames that have a cache file."""
+    global _CACHED_USERS
+    if _CACHED_USERS is None:
+        _CACHED_USERS = {entry.name[:-len('.json')] for entry in _scan_user_cache()}
+    return _CACHED_USERS
+
+
 def load_user_cache(username: str) -> Optional[Dict]:
     """Load cached user data if it exists."""
-    ensure_users_dir()
-    cache_file = USERS_CACHE_DIR / f"{username}.json"
+    # Skip the disk probe for users we know have no cache file
+    if username not in _cached_users():
+        return None
     
-    if cache_file.exists():
-        try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            warning(f"Error loading cache for {username}: {e}")
+    cache_file = USERS_CACHE_DIR / f"{username}.json"
+    try:
+        return jsonio.loads(cache_file.read_bytes())
+    except FileNotFoundError:
+        _cached_users().discard(username)
+    except Exception as e:
+        warning(f"Error loading cache for {username}: {e}")
     return None
 
 
@@ -39,52 +117,173 @@ def save_user_cache(username: str, user_data: Dict):
     cache_file = USERS_CACHE_DIR / f"{username}.json"
     
     try:
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(user_data, f, ensure_ascii=False, indent=2)
+        with open(cache_file, 'wb') as f:
+            f.write(jsonio.dumps(user_data, indent=True))
+        _cached_users().add(username)
     except Exception as e:
         warning(f"Error saving cache for {username}: {e}")
 
 
+def _is_stale(username: str, max_age_days: float = USER_CACHE_MAX_AGE_DAYS) -> bool:
+    """Check whether a user's cache file is older than max_age_days."""
+    try:
+        mtime = (USERS_CACHE_DIR / f"{username}.json").stat().st_mtime
+    except OSError:
+        return True
+    return time.time() - mtime >= max_age_days * 86400
+
+
+def _user_cache_entry(username: str, user_data: Dict[str, Any], etag: Optional[str] = None) -> Dict[str, Any]:
+    """Build the cached record for a user from REST-style user data."""
+    return {
+        'login': username,
+        'name': user_data.get('name') or username,
+        'url': user_data.get('html_url', f"https://github.com/{username}"),
+        'avatar_url': user_data.get('avatar_url', ''),
+        'bio': user_data.get('bio', ''),
+        'company': user_data.get('company', ''),
+        'location': user_data.get('location', ''),
+        'etag': etag
+    }
+
+
+def _not_found_users() -> Dict[str, float]:
+    """Return the users recorded as missing, read lazily from disk."""
+    global _NOT_FOUND
+    if _NOT_FOUND is None:
+        try:
+            _NOT_FOUND = jsonio.loads(NOT_FOUND_CACHE_FILE.read_bytes())
+        except FileNotFoundError:
+            _NOT_FOUND = {}
+        except Exception as e:
+            warning(f"Error loading {NOT_FOUND_CACHE_FILE}: {e}")
+            _NOT_FOUND = {}
+    return _NOT_FOUND
+
+
+def _is_known_missing(username: str) -> bool:
+    """Check whether GitHub reported the user as missing within NOT_FOUND_TTL."""
+    seen_at = _not_found_users().get(username)
+    return seen_at is not None and time.time() - seen_at < NOT_FOUND_TTL
+
+
+def _save_not_found(username: str):
+    """Record, for NOT_FOUND_TTL seconds, that GitHub reported a user as missing."""
+    warning(f"User {username} not found on GitHub")
+    with _NOT_FOUND_LOCK:
+        missing = _not_found_users()
+        missing[username] = time.time()
+        try:
+            NOT_FOUND_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            NOT_FOUND_CACHE_FILE.write_bytes(jsonio.dumps(missing, indent=True))
+        except Exception as e:
+            warning(f"Error saving {NOT_FOUND_CACHE_FILE}: {e}")
+
+
 def get_user_full_name(username: str, token: Optional[str] = None) -> str:
     """Get the full name for a GitHub username, using cache when possible."""
-    # Check cache first
+    if username not in _user_names:
+        _user_names[username] = _fetch_user_full_name(username, token)
+    return _user_names[username]
+
+
+def prefetch_user_names(usernames: Iterable[str], token: Optional[str]) -> None:
+    """Resolve full names for many users, batching uncached ones into GraphQL queries.
+    
+    Without a token (GraphQL requires one), or for users the batch could not
+    resolve, the per-user REST lookups are run concurrently instead. Cached
+    users older than USER_CACHE_MAX_AGE_DAYS are revalidated the same way.
+    """
+    unknown = []
+    stale = []
+    for username in set(usernames):
+        if username in _user_names:
+            continue
+        cached_data = load_user_cache(username)
+        if cached_data:
+            _user_names[username] = cached_data.get('name') or username
+            if _is_stale(username):
+                stale.append(username)
+        elif _is_known_missing(username):
+            _user_names[username] = username
+        else:
+            unknown.append(username)
+    
+    if unknown and token:
+        for username, user_data in fetch_users_batch(unknown, token).items():
+            if user_data is None:
+                _save_not_found(username)
+                _user_names[username] = username
+                continue
+            
+            entry = _user_cache_entry(username, user_data)
+            save_user_cache(username, entry)
+            _user_names[username] = entry['name']
+        
+        unknown = [username for username in unknown if username not in _user_names]
+    
+    # Stale entries keep their cached name unless revalidation brings a new one
+    unknown.extend(stale)
+    
+    # Remaining REST lookups are independent; the session pool bounds connections
+    if unknown:
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            full_names = executor.map(lambda username: _fetch_user_full_name(username, token), unknown)
+            _user_names.update(zip(unknown, full_names))
+
+
+def _fetch_user_full_name(username: str, token: Optional[str]) -> str:
+    """Resolve a full name from the disk cache or a single REST lookup."""
+    if username not in _cached_users() and _is_known_missing(username):
+        return username
+    
+    # Cached users are returned as is, or revalidated once stale
+    user_data = refresh_user_cache(username, token)
+    if user_data:
+        return user_data.get('name') or username
+    
+    # Return username as fallback
+    return username
+
+
+def refresh_user_cache(username: str, token: Optional[str] = None,
+                       max_age_days: float = USER_CACHE_MAX_AGE_DAYS) -> Optional[Dict]:
+    """Revalidate a cached user against GitHub and return the current user data.
+    
+    Entries younger than max_age_days are returned without a request. Older
+    ones are revalidated with If-None-Match using the stored ETag, so an
+    unchanged user costs a 304 (not counted against the rate limit) and only
+    has its file mtime touched. Users with no cache entry are fetched.
+    """
+    cache_file = USERS_CACHE_DIR / f"{username}.json"
     cached_data = load_user_cache(username)
-    if cached_data:
-        return cached_data.get('name') or username
+    if cached_data and not _is_stale(username, max_age_days):
+        return cached_data
     
-    # Make API call to get user info
-    headers = {"Accept": "application/vnd.github.v3+json"}
-    if token:
-        headers["Authorization"] = f"token {token}"
+    headers = {"Authorization": f"token {token}"} if token else {}
+    if cached_data and cached_data.get('etag'):
+        headers["If-None-Match"] = cached_data['etag']
     
     user_url = f"https://api.github.com/users/{username}"
     try:
-        response = requests.get(user_url, headers=headers, timeout=10)
-        if response.status_code == 200:
-            user_data = response.json()
-            full_name = user_data.get('name') or username
-            
-            # Save to cache
-            save_user_cache(username, {
-                'login': username,
-                'name': full_name,
-                'url': user_data.get('html_url', f"https://github.com/{username}"),
-                'avatar_url': user_data.get('avatar_url', ''),
-                'bio': user_data.get('bio', ''),
-                'company': user_data.get('company', ''),
-                'location': user_data.get('location', '')
-            })
-            
-            return full_name
+        response = _SESSION.get(user_url, headers=headers, timeout=10)
+        if response.status_code == 304:
+            cache_file.touch()
+            return cached_data
+        elif response.status_code == 200:
+            entry = _user_cache_entry(username, jsonio.loads(response.content), response.headers.get('ETag'))
+            save_user_cache(username, entry)
+            _user_names[username] = entry['name']
+            return entry
         elif response.status_code == 404:
-            warning(f"User {username} not found on GitHub")
+            _save_not_found(username)
         else:
-            warning(f"Error fetching user {username}: HTTP {response.status_code}")
+            warning(f"Error refreshing user {username}: HTTP {response.status_code}")
     except Exception as e:
-        warning(f"Error fetching user info for {username}: {e}")
+        warning(f"Error refreshing user info for {username}: {e}")
     
-    # Return username as fallback
-    return username
+    # Fall back to whatever we had cached
+    return cached_data
 
 
 def extract_repo_from_path(file_path: Path) -> Optional[str]:
@@ -106,82 +305,82 @@ def extract_repo_from_path(file_path: Path) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=256)
+def _repo_pattern(repo: str) -> re.Pattern:
+    """Compile the title-line pattern for a repository name.
+    
+    Existing links are matched so they can be kept, and anything that is part
+    of a URL (preceded by github.com/) is skipped.
+    """
+    return re.compile(
+        rf'(?P<link>\[[^\]]+\]\([^)]+\))|(?<!github\.com/)\b{re.escape(repo)}\b'
+    )
+
+
 def add_github_links(text: str, repo: Optional[str], token: Optional[str]) -> str:
     """Convert @username references to GitHub links with full names."""
     
-    # First, protect existing markdown links by temporarily replacing them
-    placeholders = {}
-    
-    # Find and replace existing markdown links with placeholders
-    existing_link_pattern = r'\[([^\]]+)\]\([^)]+\)'
-    
-    def create_placeholder(match):
-        placeholder = f"__LINK_PLACEHOLDER_{uuid.uuid4().hex}__"
-        placeholders[placeholder] = match.group(0)
-        return placeholder
-    
-    # Replace existing links with placeholders
-    text = re.sub(existing_link_pattern, create_placeholder, text)
+    # Scan the text once; the matches drive both the prefetch and the rewrite
+    matches = list(REFERENCE_PATTERN.finditer(text))
     
-    # Pattern to match @username (but not if already in a link)
-    username_pattern = r'@([a-zA-Z0-9](?:[a-zA-Z0-9\-]*[a-zA-Z0-9])?)'
+    # Resolve every mentioned user up front so substitution is a dict lookup
+    # (mentions inside existing links are skipped, as they are never rewritten)
+    prefetch_user_names(
+        (match.group('user') for match in matches if match.lastgroup == 'user'),
+        token
+    )
     
-    def replace_username_reference(match):
-        username = match.group(1)
-        full_name = get_user_full_name(username, token)
-        url = f"https://github.com/{username}"
+    def replace_reference(match):
+        kind = match.lastgroup
         
-        # Use full name if different from username, otherwise just use @username
-        if full_name != username:
-            return f"[{full_name}]({url})"
-        else:
-            return f"[@{username}]({url})"
-    
-    # Apply username transformations
-    text = re.sub(username_pattern, replace_username_reference, text)
-    
-    # Add issue/PR links if we know the repository
-    if repo:
-        # Pattern to match #1234 (issue/PR references)
-        # Only match if not preceded by / (to avoid matching in URLs)
-        issue_pattern = r'(?<!/)#(\d+)\b'
+        if kind == 'user':
+            username = match.group('user')
+            full_name = get_user_full_name(username, token)
+            url = f"https://github.com/{username}"
+            
+            # Use full name if different from username, otherwise just use @username
+            if full_name != username:
+                return f"[{full_name}]({url})"
+            else:
+                return f"[@{username}]({url})"
         
-        def replace_issue_reference(match):
-            issue_number = match.group(1)
+        # Add issue/PR links if we know the repository
+        if kind == 'issue' and repo:
+            issue_number = match.group('issue')
             url = f"https://github.com/{repo}/issues/{issue_number}"
             return f"[#{issue_number}]({url})"
         
-        # Apply issue/PR transformations
-        text = re.sub(issue_pattern, replace_issue_reference, text)
-    
-    # Pattern to match user/repo#1234 (full repo issue/PR references)
-    # This handles the new format from aggregate summaries
-    full_repo_issue_pattern = r'\b([a-zA-Z0-9][a-zA-Z0-9\-]*[a-zA-Z0-9]/[a-zA-Z0-9][a-zA-Z0-9\-_.]*[a-zA-Z0-9])#(\d+)\b'
-    
-    def replace_full_repo_issue_reference(match):
-        repo_name = match.group(1)
-        issue_number = match.group(2)
-        url = f"https://github.com/{repo_name}/issues/{issue_number}"
-        return f"[{repo_name}#{issue_number}]({url})"
-    
-    # Apply full repo issue/PR transformations
-    text = re.sub(full_repo_issue_pattern, replace_full_repo_issue_reference, text)
+        # Full repo issue/PR references handle the format from aggregate summaries
+        if kind == 'full_issue':
+            repo_name = match.group('full_repo')
+            issue_number = match.group('full_number')
+            url = f"https://github.com/{repo_name}/issues/{issue_number}"
+            return f"[{repo_name}#{issue_number}]({url})"
+        
+        # Existing links (and #1234 without a known repo) are left as they are
+        return match.group(0)
+    
+    # Apply all link transformations in a single pass, writing the unchanged
+    # text between matches straight into one output buffer
+    output = io.StringIO()
+    pos = 0
+    for match in matches:
+        output.write(text[pos:match.start()])
+        output.write(replace_reference(match))
+        pos = match.end()
+    output.write(text[pos:])
+    text = output.getvalue()
     
     # Add repository link if it's not already linked (only for the current repo)
     if repo:
-        # But skip if it's part of a URL (contains github.com/)
-        repo_pattern = rf'(?<!github\.com/)\b{re.escape(repo)}\b'
         repo_replacement = f"[{repo}](https://github.com/{repo})"
         
+        def replace_repo_reference(match):
+            return match.group(0) if match.lastgroup == 'link' else repo_replacement
+        
         # Only replace in the title line (first line)
-        lines = text.split('\n')
-        if lines:
-            lines[0] = re.sub(repo_pattern, repo_replacement, lines[0])
-            text = '\n'.join(lines)
-    
-    # Restore the original markdown links
-    for placeholder, original in placeholders.items():
-        text = text.replace(placeholder, original)
+        title, newline, body = text.partition('\n')
+        text = _repo_pattern(repo).sub(replace_repo_reference, title) + newline + body
     
     return text
 
@@ -189,20 +388,19 @@ def add_github_links(text: str, repo: Optional[str], token: Optional[str]) -> st
 def deduplicate_contributors_section(text: str) -> str:
     """Remove duplicates from the Contributors section."""
     # Find the Contributors section
-    contributors_match = re.search(r'## Contributors\s*\n(.*?)(?=\n##|\Z)', text, re.DOTALL)
+    contributors_match = CONTRIBUTORS_SECTION_PATTERN.search(text)
     if not contributors_match:
         return text
     
     contributors_content = contributors_match.group(1).strip()
     
-    # Extract all contributor links using regex
-    contributor_links = re.findall(r'\[([^\]]+)\]\(https://github\.com/([^)]+)\)', contributors_content)
-    
-    # Deduplicate by GitHub username (second group in match)
+    # Deduplicate contributor links by GitHub username (second group in match)
     seen_usernames: Set[str] = set()
     unique_contributors = []
     
-    for display_name, github_path in contributor_links:
+    for link_match in GITHUB_LINK_PATTERN.finditer(contributors_content):
+        display_name, github_path = link_match.groups()
+        
         # Skip if this is an issue/PR link (contains /issues/ or /pull/)
         if '/issues/' in github_path or '/pull/' in github_path:
             continue
@@ -217,8 +415,8 @@ def deduplicate_contributors_section(text: str) -> str:
             unique_contributors.append(f"[{display_name}](https://github.com/{username})")
     
     # Also check for @username patterns that might not be linked yet
-    username_mentions = re.findall(r'@([a-zA-Z0-9](?:[a-zA-Z0-9\-]*[a-zA-Z0-9])?)', contributors_content)
-    for username in username_mentions:
+    for mention_match in USERNAME_PATTERN.finditer(contributors_content):
+        username = mention_match.group(1)
         if username not in seen_usernames:
             seen_usernames.add(username)
             unique_contributors.append(f"[@{username}](https://github.com/{username})")
@@ -232,13 +430,9 @@ def deduplicate_contributors_section(text: str) -> str:
         new_contributors_section += "Thank you to all contributors for their work during this period:\n\n"
         new_contributors_section += ", ".join(unique_contributors)
         
-        # Replace the old section with the new one
-        return re.sub(
-            r'## Contributors\s*\n.*?(?=\n##|\Z)',
-            new_contributors_section,
-            text,
-            flags=re.DOTALL
-        )
+        # Splice the new section over the one we already located
+        start, end = contributors_match.span()
+        return text[:start] + new_contributors_section + text[end:]
     
     return text
 
@@ -333,17 +527,26 @@ def annotate_file(input_file: Path, output_file: Path, token: Optional[str]) ->
 
 def clear_user_cache() -> int:
     """Clear the user cache and return the number of files removed."""
+    global _CACHED_USERS, _NOT_FOUND
+    # The "not found" records go too
+    with _NOT_FOUND_LOCK:
+        try:
+            NOT_FOUND_CACHE_FILE.unlink()
+        except FileNotFoundError:
+            pass
+        _NOT_FOUND = None
+    
     if not USERS_CACHE_DIR.exists():
         return 0
     
-    cache_files = list(USERS_CACHE_DIR.glob("*.json"))
+    cache_files = _scan_user_cache()
     count = len(cache_files)
     
     for cache_file in cache_files:
         try:
-            cache_file.unlink()
+            os.unlink(cache_file.path)
         except Exception as e:
-            warning(f"Error removing cache file {cache_file}: {e}")
+            warning(f"Error removing cache file {cache_file.path}: {e}")
     
     try:
         USERS_CACHE_DIR.rmdir()
@@ -351,29 +554,33 @@ def clear_user_cache() -> int:
         # Directory might not be empty due to errors above
         pass
     
+    # Forget names and cache entries memoized from the files we just removed
+    _user_names.clear()
+    _CACHED_USERS = None
+    
     return count
 
 
 def get_cache_stats() -> Dict:
     """Get statistics about the user cache."""
-    if not USERS_CACHE_DIR.exists():
+    cache_files = _scan_user_cache()
+    if not cache_files:
         return {"count": 0, "size": 0, "users": []}
     
-    cache_files = list(USERS_CACHE_DIR.glob("*.json"))
-    total_size = sum(f.stat().st_size for f in cache_files)
+    total_size = sum(entry.stat().st_size for entry in cache_files)
     
     users = []
     for cache_file in cache_files[:10]:  # Sample first 10
+        username = cache_file.name[:-len('.json')]
         try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-                users.append({
-                    "username": cache_file.stem,
-                    "name": data.get('name', 'N/A')
-                })
+            data = jsonio.loads(Path(cache_file.path).read_bytes())
+            users.append({
+                "username": username,
+                "name": data.get('name', 'N/A')
+            })
         except Exception:
             users.append({
-                "username": cache_file.stem,
+                "username": username,
                 "name": "(error reading)"
             })
     
@@ -1,13 +1,16 @@
 """Common utilities for running Claude CLI."""
 
-import json
 import subprocess
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any
 
+from . import jsonio
 
-def run_claude_cli(prompt_file: Path, claude_command: str, claude_args: List[str], log_file: Path) -> Dict[str, Any]:
+
+def run_claude_cli(prompt_file: Path, claude_command: str, claude_args: List[str], log_file: Path,
+                   content_only: bool = False) -> Dict[str, Any]:
     """Run Claude CLI with the given prompt file using streaming JSON output.
     
     Args:
@@ -15,9 +18,14 @@ def run_claude_cli(prompt_file: Path, claude_command: str, claude_args: List[str
         claude_command: Claude command to run (e.g., 'claude')
         claude_args: List of arguments to pass to Claude
         log_file: Path to save the session log including streaming output
+        content_only: Keep only the extracted content, not the individual
+            streaming events, in memory, the log and the result. Lines that
+            are not JSON are logged either way
         
     Returns:
-        Dictionary with success status, stdout, stderr, and log_file
+        Dictionary with success status, stderr, parsed streaming output, and
+        log_file. Stdout is parsed line by line as it arrives rather than
+        buffered, so it is not returned.
     """
     # Read the prompt content
     try:
@@ -70,35 +78,83 @@ def run_claude_cli(prompt_file: Path, claude_command: str, claude_args: List[str
     cmd = [claude_command] + final_args
     
     try:
-        # Run Claude with the prompt as stdin
-        result = subprocess.run(
+        # Run Claude with the prompt as stdin, reading stdout as it is produced
+        process = subprocess.Popen(
             cmd,
-            input=prompt_content,
-            capture_output=True,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=600  # 10 minute timeout
+            bufsize=1
         )
         
+        # Feed stdin and drain stderr on helper threads so neither pipe can fill
+        # up and block Claude while we are reading stdout
+        stderr_parts = []
+        
+        def feed_stdin():
+            try:
+                process.stdin.write(prompt_content)
+                process.stdin.close()
+            except (BrokenPipeError, OSError):
+                pass
+        
+        helpers = [
+            threading.Thread(target=feed_stdin, daemon=True),
+            threading.Thread(target=lambda: stderr_parts.append(process.stderr.read()), daemon=True),
+        ]
+        for helper in helpers:
+            helper.start()
+        
+        # Kill the process if it runs past the 10 minute timeout; this ends the
+        # stdout loop below
+        timed_out = threading.Event()
+        
+        def on_timeout():
+            timed_out.set()
+            process.kill()
+        
+        timer = threading.Timer(600, on_timeout)
+        timer.start()
+        
         # Parse streaming JSON output to extract meaningful content
         streaming_output = []
-        final_content = ""
+        content_parts = []
+        unparsed_lines = []
         
         # Each line in stdout should be a JSON object when using stream-json
-        for line in result.stdout.splitlines():
-            if line.strip():
-                try:
-                    json_obj = json.loads(line)
-                    streaming_output.append(json_obj)
-                    
-                    # Extract content from different event types
-                    if json_obj.get("type") == "content" and "text" in json_obj:
-                        final_content += json_obj["text"]
-                    elif json_obj.get("type") == "text" and "text" in json_obj:
-                        final_content += json_obj["text"]
+        try:
+            for line in process.stdout:
+                if line.strip():
+                    try:
+                        json_obj = jsonio.loads(line)
+                        if not content_only:
+                            streaming_output.append(json_obj)
                         
-                except json.JSONDecodeError:
-                    # Some lines might not be JSON (e.g., error messages)
-                    pass
+                        # Extract content from different event types
+                        if json_obj.get("type") == "content" and "text" in json_obj:
+                            content_parts.append(json_obj["text"])
+                        elif json_obj.get("type") == "text" and "text" in json_obj:
+                            content_parts.append(json_obj["text"])
+                            
+                    except jsonio.JSONDecodeError:
+                        # Some lines might not be JSON (e.g., error messages)
+                        unparsed_lines.append(line)
+            return_code = process.wait()
+        finally:
+            timer.cancel()
+            # Don't leave Claude running if parsing failed part way through
+            if process.poll() is None:
+                process.kill()
+        
+        for helper in helpers:
+            helper.join()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, 600)
+        
+        final_content = "".join(content_parts)
+        stderr = "".join(stderr_parts)
         
         # Save comprehensive session log
         session_log = {
@@ -107,31 +163,34 @@ def run_claude_cli(prompt_file: Path, claude_command: str, claude_args: List[str
             "prompt_file": str(prompt_file),
             "prompt_method": "stdin",
             "output_format": "stream-json",
-            "return_code": result.returncode,
-            "streaming_events": streaming_output,
+            "return_code": return_code,
             "extracted_content": final_content,
-            "raw_stdout": result.stdout,
-            "stderr": result.stderr
+            "stderr": stderr
         }
         
+        if not content_only:
+            session_log["streaming_events"] = streaming_output
+        # The parsed events already carry their lines of stdout; the lines that
+        # did not parse are recorded nowhere else, so always keep those
+        if unparsed_lines:
+            session_log["raw_stdout"] = "".join(unparsed_lines)
+        
         # Write session log to file
-        log_file.write_text(json.dumps(session_log, indent=2))
+        log_file.write_bytes(jsonio.dumps(session_log, indent=True))
         
         # Check if Claude ran successfully
-        if result.returncode != 0:
+        if return_code != 0:
             return {
                 "success": False,
-                "error": result.stderr or "Claude CLI failed",
-                "stdout": result.stdout,
-                "stderr": result.stderr,
+                "error": stderr or "Claude CLI failed",
+                "stderr": stderr,
                 "streaming_output": streaming_output,
                 "log_file": log_file
             }
         
         return {
             "success": True,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
+            "stderr": stderr,
             "streaming_output": streaming_output,
             "extracted_content": final_content,
             "log_file": log_file
@@ -147,7 +206,7 @@ def run_claude_cli(prompt_file: Path, claude_command: str, claude_args: List[str
             "output_format": "stream-json",
             "error": "Process timed out after 600 seconds"
         }
-        log_file.write_text(json.dumps(session_log, indent=2))
+        log_file.write_bytes(jsonio.dumps(session_log, indent=True))
         
         return {
             "success": False,
@@ -166,7 +225,7 @@ def run_claude_cli(prompt_file: Path, claude_command: str, claude_args: List[str
             "output_format": "stream-json",
             "error": str(e)
         }
-        log_file.write_text(json.dumps(session_log, indent=2))
+        log_file.write_bytes(jsonio.dumps(session_log, indent=True))
         
         return {
             "success": False,
@@ -188,26 +247,26 @@ def validate_summary_file(summary_file: Path) -> bool:
         return False
     
     try:
-        with open(summary_file) as f:
-            content = f.read()
-            
-            # Check if it's stream-json logs (Claude CLI output)
-            if "stream-json" in content or "MessageStream" in content:
-                return False
-            
-            # Try to parse as JSON
-            data = json.loads(content)
-            
-            # Check for required fields based on file type
-            # Group summaries have 'group' field, individual summaries have 'repo' field
-            if "group" in data:
-                required_fields = ["week", "year", "group"]
-            else:
-                required_fields = ["week", "year", "repo"]
-            
-            return all(field in data for field in required_fields)
-            
-    except json.JSONDecodeError:
+        # Read raw bytes once and hand them straight to the JSON parser
+        content = summary_file.read_bytes()
+        
+        # Check if it's stream-json logs (Claude CLI output)
+        if b"stream-json" in content or b"MessageStream" in content:
+            return False
+        
+        # Try to parse as JSON
+        data = jsonio.loads(content)
+        
+        # Check for required fields based on file type
+        # Group summaries have 'group' field, individual summaries have 'repo' field
+        if "group" in data:
+            required_fields = ["week", "year", "group"]
+        else:
+            required_fields = ["week", "year", "repo"]
+        
+        return all(field in data for field in required_fields)
+        
+    except jsonio.JSONDecodeError:
         return False
     except Exception:
         return False
\ No newline at end of file
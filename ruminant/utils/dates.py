@@ -1,7 +1,9 @@
 """Date and week utilities."""
 
-from datetime import datetime, timedelta
-from typing import List, Tuple
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+from dateutil.parser import parse
 import pytz
 
 
@@ -21,13 +23,15 @@ def get_last_complete_week() -> Tuple[int, int]:
     """Get the year and week number of the last complete week."""
     now = datetime.now()
     last_week = now - timedelta(days=7)
-    return last_week.isocalendar()[0], last_week.isocalendar()[1]
+    iso_year, iso_week, _ = last_week.isocalendar()
+    return iso_year, iso_week
 
 
 def get_current_week() -> Tuple[int, int]:
     """Get the year and week number of the current week."""
     now = datetime.now()
-    return now.isocalendar()[0], now.isocalendar()[1]
+    iso_year, iso_week, _ = now.isocalendar()
+    return iso_year, iso_week
 
 
 def get_week_list(num_weeks: int, end_year: int = None, end_week: int = None) -> List[Tuple[int, int]]:
@@ -37,21 +41,20 @@ def get_week_list(num_weeks: int, end_year: int = None, end_week: int = None) ->
 
     weeks = []
 
-    # Start from the Monday of the end week
+    # Start from the Monday of the oldest week
     # ISO 8601: Week 1 is the week with January 4th in it
     jan_4 = datetime(end_year, 1, 4)
     week_1_start = jan_4 - timedelta(days=jan_4.weekday())
-    current_date = week_1_start + timedelta(weeks=end_week - 1)
+    current_date = week_1_start + timedelta(weeks=end_week - num_weeks)
+    one_week = timedelta(weeks=1)
 
-    for i in range(num_weeks):
-        iso_date = current_date.isocalendar()
-        weeks.append((iso_date[0], iso_date[1]))
+    # Walk forward so the list comes out in chronological order (oldest first)
+    for _ in range(num_weeks):
+        iso_year, iso_week, _weekday = current_date.isocalendar()
+        weeks.append((iso_year, iso_week))
+        current_date += one_week
 
-        # Move to previous week
-        current_date = current_date - timedelta(weeks=1)
-
-    # Return in chronological order (oldest first)
-    return list(reversed(weeks))
+    return weeks
 
 
 def format_week_range(year: int, week: int) -> str:
@@ -60,8 +63,51 @@ def format_week_range(year: int, week: int) -> str:
     return f"{week_start.strftime('%Y-%m-%d')} to {week_end.strftime('%Y-%m-%d')}"
 
 
+# The same timestamps recur across timeline items and pages, so parsed values
+# are memoized; both results are immutable and safe to share
+@lru_cache(maxsize=4096)
+def parse_timestamp(timestamp_str: str) -> datetime:
+    """Parse an ISO 8601 timestamp, such as those returned by GitHub."""
+    # GitHub timestamps are strict ISO 8601, which fromisoformat parses far
+    # faster than dateutil; it only lacks support for "Z" before Python 3.11
+    try:
+        return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+    except ValueError:
+        return parse(timestamp_str)
+
+
+@lru_cache(maxsize=4096)
+def iso_to_timestamp(timestamp_str: str) -> float:
+    """Convert an ISO 8601 timestamp to seconds since the epoch."""
+    return parse_timestamp(timestamp_str).timestamp()
+
+
 def is_in_week_range(timestamp_str: str, week_start: datetime, week_end: datetime) -> bool:
     """Check if the timestamp falls within the specified week range."""
-    from dateutil.parser import parse
-    timestamp = parse(timestamp_str)
-    return week_start <= timestamp <= week_end
\ No newline at end of file
+    return week_start <= parse_timestamp(timestamp_str) <= week_end
+
+
+def filter_in_week_range(timestamps: Iterable[Optional[str]], week_start: datetime, week_end: datetime) -> List[bool]:
+    """Check a batch of timestamps against the week range, returning one flag per timestamp.
+    
+    Canonical GitHub UTC timestamps (YYYY-MM-DDTHH:MM:SSZ) sort lexically in
+    time order, so they are compared as strings against the bounds rendered the
+    same way, with no parsing. Other formats fall back to is_in_week_range.
+    Missing (None or empty) timestamps are never in range.
+    """
+    # String comparison needs aware bounds and a start on a whole second
+    if week_start.tzinfo is None or week_end.tzinfo is None or week_start.microsecond:
+        return [bool(ts) and is_in_week_range(ts, week_start, week_end) for ts in timestamps]
+    
+    start = week_start.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    end = week_end.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    
+    results = []
+    for ts in timestamps:
+        if not ts:
+            results.append(False)
+        elif len(ts) == 20 and ts[-1] == "Z":
+            results.append(start <= ts <= end)
+        else:
+            results.append(is_in_week_range(ts, week_start, week_end))
+    return results
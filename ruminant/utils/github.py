@@ -1,34 +1,199 @@
 """GitHub API utilities adapted from the original gh-fetch.py."""
 
+import logging
+import random
+import re
+import threading
 import time
 import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from functools import lru_cache
+from itertools import islice
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterator, List, Optional, Tuple, Any
+from urllib.parse import parse_qs, urlparse
+from urllib3.util.retry import Retry
 
-from .dates import is_in_week_range
+from . import jsonio
+from .dates import filter_in_week_range, iso_to_timestamp
 from .logging import error, warning, info
 
+# Per-page progress goes to the standard logging module at DEBUG level, so it
+# costs nothing unless enabled (RUMINANT_LOG=DEBUG)
+_LOG = logging.getLogger("ruminant.github")
 
-def fetch_graphql_data(query: str, variables: Dict[str, Any], headers: Dict[str, str]) -> Optional[Dict]:
-    """Fetch data from GraphQL API with retries."""
-    url = "https://api.github.com/graphql"
+
+# Shared HTTP session so API calls reuse pooled keep-alive connections. Only
+# idempotent requests are retried here; GraphQL POSTs are retried by
+# fetch_graphql_data, which also handles rate limits.
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=100,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    ),
+)
+_SESSION.mount("http://", _adapter)
+_SESSION.mount("https://", _adapter)
+
+# GraphQL requests in flight at once across all threads. Repositories and
+# their issues, PRs, discussions and releases are fetched concurrently; this
+# keeps the fan-out within GitHub's secondary rate limits.
+MAX_CONCURRENT_GRAPHQL = 8
+_GRAPHQL_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_GRAPHQL)
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# @mentions - must start with a letter and can contain letters, numbers, and hyphens.
+# This avoids matching things like @15 or @21 which are likely line numbers
+MENTION_PATTERN = re.compile(r'@([a-zA-Z][a-zA-Z0-9-]{0,38})')
+
+# Issues and PRs fetched per GraphQL request (the API maximum). One large page
+# replaces several round trips of the same query on busy repositories.
+ISSUES_PAGE_SIZE = 100
+
+# Shared read-only default for missing GraphQL objects
+_EMPTY: Dict[str, Any] = {}
+
+
+# Exponential backoff between GraphQL retries, in seconds
+RETRY_BASE_DELAY = 1
+RETRY_MAX_DELAY = 60
+# Minimum wait after a secondary rate limit that gives no Retry-After
+SECONDARY_RATE_LIMIT_DELAY = 60
+
+
+# Last 200 response per REST request and its decoded body, revalidated with
+# its ETag. A 304 reply does not count against the rate limit, so re-reading
+# the same pages (e.g. the latest releases for each week being synced) is
+# free, and the body is not decoded again.
+_ETAG_CACHE: Dict[Tuple[str, Tuple, Optional[str]], Tuple[requests.Response, Any]] = {}
+
+
+def _get_json_with_etag(url: str, headers: Dict[str, str], params: Optional[Dict[str, Any]] = None,
+                        timeout: float = 10) -> Tuple[requests.Response, Any]:
+    """GET a REST resource, answering from the ETag cache when it is unchanged.
+    
+    Returns the response and its decoded JSON body, which is None for
+    anything but a 200 response. Cached bodies are shared between callers
+    and must not be modified.
+    """
+    key = (url, tuple(sorted((params or {}).items())), headers.get("Authorization"))
+    cached = _ETAG_CACHE.get(key)
+    if cached is not None:
+        headers = {**headers, "If-None-Match": cached[0].headers["ETag"]}
+    
+    response = _SESSION.get(url, headers=headers, params=params, timeout=timeout)
+    if response.status_code == 304 and cached is not None:
+        return cached
+    if response.status_code != 200:
+        return response, None
     
+    data = jsonio.loads(response.content)
+    if response.headers.get("ETag"):
+        _ETAG_CACHE[key] = (response, data)
+    return response, data
+
+
+@lru_cache(maxsize=32)
+def _compact_query(query: str) -> str:
+    """Collapse the indentation and newlines in a GraphQL document.
+    
+    Whitespace is insignificant in GraphQL outside string literals, which
+    the queries here never contain (strings are passed as variables).
+    """
+    return " ".join(query.split())
+
+
+def _retry_delay(attempt: int) -> float:
+    """Return the backoff before retry number attempt, with jitter."""
+    return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+def _is_rate_limited(response: requests.Response) -> bool:
+    """Check whether a 403 or 429 response is a rate limit rather than a refusal."""
+    if response.status_code == 429:
+        return True
+    headers = response.headers
+    if headers.get('Retry-After') or headers.get('X-RateLimit-Remaining') == '0':
+        return True
+    # Secondary rate limits don't always send headers, but say so in the body
+    return b"rate limit" in response.content.lower()
+
+
+def _rate_limit_delay(headers: Dict[str, str], attempt: int) -> Tuple[float, str]:
+    """Return how long to wait before retrying a rate limited request, and why."""
+    # Secondary rate limits may say how long to back off for
+    retry_after = headers.get('Retry-After')
+    if retry_after:
+        return float(retry_after), "Secondary rate limit hit"
+    
+    # The primary rate limit is used up until its reset time
+    rate_limit_reset = headers.get('X-RateLimit-Reset')
+    if headers.get('X-RateLimit-Remaining') == '0' and rate_limit_reset:
+        reset_time = datetime.fromtimestamp(int(rate_limit_reset))
+        return max(0, int(rate_limit_reset) - time.time()) + 1, f"Rate limit exceeded until {reset_time}"
+    
+    # Otherwise a secondary rate limit; GitHub asks for at least a minute
+    return max(SECONDARY_RATE_LIMIT_DELAY, _retry_delay(attempt)), "Secondary rate limit hit"
+
+
+def _post_graphql(query: str, variables: Dict[str, Any], headers: Dict[str, str]) -> requests.Response:
+    """POST a GraphQL query, waiting for a free request slot first."""
+    # Encode the body with jsonio (orjson when installed) instead of letting
+    # requests run it through the stdlib encoder
+    body = jsonio.dumps({"query": query, "variables": variables})
+    headers = {**headers, "Content-Type": "application/json"}
+    with _GRAPHQL_SLOTS:
+        return _SESSION.post(GRAPHQL_URL, data=body, headers=headers, timeout=30)
+
+
+def fetch_graphql_data(query: str, variables: Dict[str, Any], headers: Dict[str, str],
+                       allow_missing: bool = False) -> Optional[Dict]:
+    """Fetch data from GraphQL API with retries.
+    
+    With allow_missing, NOT_FOUND errors for individual fields (such as one
+    of many aliased lookups) are tolerated: the result is returned with those
+    fields null, for the caller to skip.
+    
+    Server errors and failed requests are retried with jittered exponential
+    backoff. Rate limited requests (HTTP 429, a 403 with rate limit headers
+    or message, or a RATE_LIMITED error) wait for Retry-After, until
+    X-RateLimit-Reset when the limit is used up, or otherwise at least a
+    minute, before retrying. Any other 403 fails at once.
+    """
     # Retry logic for GraphQL API
-    max_retries = 3
+    max_retries = 6
     for attempt in range(max_retries):
         try:
-            response = requests.post(
-                url, json={"query": query, "variables": variables}, headers=headers, timeout=30
-            )
+            response = _post_graphql(_compact_query(query), variables, headers)
             
             if response.status_code == 200:
-                result = response.json()
+                result = jsonio.loads(response.content)
                 
                 # Check for GraphQL errors
                 if "errors" in result and result["errors"]:
+                    # Rate limits can also come back as errors in a 200 response
+                    if any(graphql_error.get("type") == "RATE_LIMITED" for graphql_error in result["errors"]):
+                        if attempt < max_retries - 1:
+                            delay, reason = _rate_limit_delay(response.headers, attempt)
+                            warning(f"{reason}, retrying in {delay:.0f} seconds...")
+                            time.sleep(delay)
+                            continue
+                        error(f"Rate limited after {max_retries} attempts")
+                        return None
+                    
                     for graphql_error in result["errors"]:
                         error_type = graphql_error.get("type", "UNKNOWN")
                         message = graphql_error.get("message", "Unknown error")
+                        if allow_missing and error_type == "NOT_FOUND" and graphql_error.get("path") and result.get("data"):
+                            continue
                         error(f"GraphQL Error ({error_type}): {message}")
                         
                         # Handle specific error types
@@ -51,38 +216,37 @@ def fetch_graphql_data(query: str, variables: Dict[str, Any], headers: Dict[str,
                     return None
                     
                 return result
-            elif response.status_code == 403:
-                # Handle rate limiting and forbidden access
-                error(f"HTTP 403 Forbidden: Access denied or rate limit exceeded")
-                
-                # Check for rate limit headers
-                rate_limit_remaining = response.headers.get('X-RateLimit-Remaining')
-                rate_limit_reset = response.headers.get('X-RateLimit-Reset')
-                
-                if rate_limit_remaining == '0':
-                    reset_time = datetime.fromtimestamp(int(rate_limit_reset)) if rate_limit_reset else None
-                    if reset_time:
-                        wait_time = (reset_time - datetime.now()).total_seconds()
-                        error(f"Rate limit exceeded. Resets at {reset_time} (in {wait_time:.0f} seconds)")
-                    else:
-                        error("Rate limit exceeded. Please wait before retrying.")
-                else:
+            elif response.status_code in [403, 429]:
+                # A 403 without any rate limit signal (bad token scopes, SSO
+                # enforcement) won't go away by waiting
+                if not _is_rate_limited(response):
+                    error(f"HTTP {response.status_code}: Access denied")
                     error("Access forbidden. Check your token permissions and repository access.")
+                    return None
                 
-                # Don't retry on 403 errors
+                # A primary or secondary rate limit: wait as long as GitHub
+                # asks, then retry
+                delay, reason = _rate_limit_delay(response.headers, attempt)
+                if attempt < max_retries - 1:
+                    warning(f"{reason}, retrying in {delay:.0f} seconds...")
+                    time.sleep(delay)
+                    continue
+                error(f"HTTP {response.status_code}: {reason}, giving up after {max_retries} attempts")
                 return None
             elif response.status_code in [502, 503, 504]:
                 if attempt < max_retries - 1:
-                    warning(f"GitHub API returned {response.status_code}, retrying in {2 ** attempt} seconds...")
-                    time.sleep(2 ** attempt)
+                    delay = _retry_delay(attempt)
+                    warning(f"GitHub API returned {response.status_code}, retrying in {delay:.1f} seconds...")
+                    time.sleep(delay)
                     continue
             else:
                 error(f"Error fetching data: {response.status_code}")
                 return None
-        except requests.RequestException as e:
+        except (requests.RequestException, jsonio.JSONDecodeError) as e:
             if attempt < max_retries - 1:
-                warning(f"Request failed: {e}, retrying in {2 ** attempt} seconds...")
-                time.sleep(2 ** attempt)
+                delay = _retry_delay(attempt)
+                warning(f"Request failed: {e}, retrying in {delay:.1f} seconds...")
+                time.sleep(delay)
                 continue
             else:
                 error(f"Failed to fetch data after {max_retries} attempts: {e}")
@@ -91,259 +255,372 @@ def fetch_graphql_data(query: str, variables: Dict[str, Any], headers: Dict[str,
     return None
 
 
-def has_activity_in_week(item: Dict[str, Any], week_start: datetime, week_end: datetime) -> bool:
-    """Check if an issue or PR had any activity during the specified week."""
-    # Check if created during the week
-    if is_in_week_range(item["createdAt"], week_start, week_end):
-        return True
+def _candidate_dates(item: Dict[str, Any]) -> Iterator[str]:
+    """Yield every date on an issue or PR that can show activity."""
+    yield item["createdAt"]
+    yield item["updatedAt"]
+    for timeline_item in (item.get("timelineItems") or _EMPTY).get("nodes", ()):
+        created_at = timeline_item.get("createdAt")
+        if created_at:
+            yield created_at
+        # Commits carry their date on the nested commit object
+        commit = timeline_item.get("commit")
+        if commit and commit.get("committedDate"):
+            yield commit["committedDate"]
+
+
+def has_activity_in_week(item: Dict[str, Any], week_start_ts: float, week_end_ts: float) -> bool:
+    """Check if an issue or PR had any activity during the specified week.
     
-    # Check if updated during the week
-    if is_in_week_range(item["updatedAt"], week_start, week_end):
-        return True
+    The week bounds are POSIX timestamps, computed once by the caller, so each
+    date is compared as a number rather than as an aware datetime.
+    """
+    return any(week_start_ts <= iso_to_timestamp(date) <= week_end_ts for date in _candidate_dates(item))
+
+
+def _format_common(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Format the fields shared by GraphQL issue and PR responses."""
+    author = node["author"]
     
-    # Check timeline items for activity during the week
-    timeline_items = item.get("timelineItems", {}).get("nodes", [])
-    for timeline_item in timeline_items:
-        # Check various date fields that might exist in timeline items
-        date_fields = ["createdAt", "committedDate"]
-        for field in date_fields:
-            if field in timeline_item:
-                if is_in_week_range(timeline_item[field], week_start, week_end):
-                    return True
-            # Handle nested commit data
-            elif "commit" in timeline_item and field in timeline_item["commit"]:
-                if is_in_week_range(timeline_item["commit"][field], week_start, week_end):
-                    return True
+    # Comments as "@author: text" strings, skipping empty ones; most items
+    # have none, so don't walk the nodes unless the count says otherwise
+    comments_data = node.get("comments") or _EMPTY
+    if comments_data.get("totalCount", 1):
+        comments = [
+            f"@{(comment['author'] or _EMPTY).get('login', 'ghost')}: {body}"
+            for comment in comments_data.get("nodes", ())
+            if (body := comment.get("bodyText"))
+        ]
+    else:
+        comments = []
     
-    return False
+    return {
+        "id": node["number"],
+        "title": node["title"],
+        "url": node["url"],
+        "user": author["login"] if author else "ghost",
+        "created_at": node["createdAt"],
+        "updated_at": node["updatedAt"],
+        "closed_at": node.get("closedAt"),
+        "body": node.get("bodyText") or "",
+        "labels": [label["name"] for label in (node.get("labels") or _EMPTY).get("nodes", ())],
+        "state": node["state"].lower(),
+        "comments": comments,
+    }
 
 
 def format_issue_entry(issue: Dict[str, Any]) -> Dict[str, Any]:
     """Format a GraphQL issue response into the expected format."""
-    comments_data = issue.get("comments", {})
-    comments_list = []
-    for comment in comments_data.get("nodes", []):
-        author = comment["author"]["login"] if comment["author"] else "ghost"
-        body = comment.get("bodyText", "")
-        if body:
-            comments_list.append(f"@{author}: {body}")
-    
-    return {
-        "id": issue["number"],
-        "title": issue["title"],
-        "url": issue["url"],
-        "user": issue["author"]["login"] if issue["author"] else "ghost",
-        "created_at": issue["createdAt"],
-        "updated_at": issue["updatedAt"],
-        "closed_at": issue.get("closedAt"),
-        "body": issue.get("bodyText", "") or "",
-        "labels": [label["name"] for label in issue.get("labels", {}).get("nodes", [])],
-        "state": issue["state"].lower(),
-        "comments": comments_list,
-    }
+    return _format_common(issue)
 
 
 def format_pr_entry(pr: Dict[str, Any]) -> Dict[str, Any]:
     """Format a GraphQL PR response into the expected format."""
-    comments_data = pr.get("comments", {})
-    comments_list = []
-    for comment in comments_data.get("nodes", []):
-        author = comment["author"]["login"] if comment["author"] else "ghost"
-        body = comment.get("bodyText", "")
-        if body:
-            comments_list.append(f"@{author}: {body}")
-    
-    return {
-        "id": pr["number"],
-        "title": pr["title"],
-        "url": pr["url"],
-        "user": pr["author"]["login"] if pr["author"] else "ghost",
-        "created_at": pr["createdAt"],
-        "updated_at": pr["updatedAt"],
-        "closed_at": pr.get("closedAt"),
+    return _format_common(pr) | {
         "merged_at": pr.get("mergedAt"),
-        "body": pr.get("bodyText", "") or "",
-        "labels": [label["name"] for label in pr.get("labels", {}).get("nodes", [])],
-        "state": pr["state"].lower(),
-        "comments": comments_list,
         "additions": pr.get("additions", 0),
         "deletions": pr.get("deletions", 0),
         "changed_files": pr.get("changedFiles", 0),
-        "mergeable": pr.get("mergeable"),
         "draft": pr.get("isDraft", False),
     }
 
 
+# Labels (lowercased) that mark an issue as suitable for newcomers
+_GFI_LABELS = frozenset({
+    "good first issue",
+    "good-first-issue",
+    "beginner friendly",
+    "beginner-friendly",
+    "easy",
+})
+
+
 def is_good_first_issue(item: Dict[str, Any]) -> bool:
     """Check if an item is tagged as a good first issue."""
-    label_names = [label["name"].lower() for label in item.get("labels", {}).get("nodes", [])]
     return any(
-        name in [
-            "good first issue",
-            "good-first-issue", 
-            "beginner friendly",
-            "beginner-friendly",
-            "easy",
-        ]
-        for name in label_names
+        label["name"].lower() in _GFI_LABELS
+        for label in (item.get("labels") or _EMPTY).get("nodes", ())
     )
 
 
-def fetch_issues(repo: str, token: Optional[str], week_start: datetime, week_end: datetime) -> Tuple[List[Dict], List[Dict], List[Dict]]:
-    """Fetch issues and PRs from a repository for a specific week using GraphQL."""
-    headers = {"Content-Type": "application/json"}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
+# Fields formatted into issue and PR entries, fetched only for items that had
+# activity in the week
+ISSUE_DETAIL_FRAGMENT = """
+fragment IssueDetails on Issue {
+    number
+    title
+    url
+    author {
+        login
+    }
+    createdAt
+    updatedAt
+    closedAt
+    bodyText
+    state
+    labels(first: 20) {
+        nodes {
+            name
+        }
+    }
+    comments(first: 10, orderBy: {field: UPDATED_AT, direction: DESC}) {
+        totalCount
+        nodes {
+            author {
+                login
+            }
+            bodyText
+        }
+    }
+}
+"""
+
+PR_DETAIL_FRAGMENT = """
+fragment PullRequestDetails on PullRequest {
+    number
+    title
+    url
+    author {
+        login
+    }
+    createdAt
+    updatedAt
+    closedAt
+    mergedAt
+    bodyText
+    state
+    labels(first: 20) {
+        nodes {
+            name
+        }
+    }
+    comments(first: 10, orderBy: {field: UPDATED_AT, direction: DESC}) {
+        totalCount
+        nodes {
+            author {
+                login
+            }
+            bodyText
+        }
+    }
+    additions
+    deletions
+    changedFiles
+    isDraft
+}
+"""
+
+
+def fetch_issue_details(owner: str, name: str, issue_numbers: List[int], pr_numbers: List[int],
+                        headers: Dict[str, str], batch_size: int = 50) -> Tuple[Dict[int, Dict], Dict[int, Dict]]:
+    """Fetch full issue and PR details by number, many per GraphQL request.
     
-    # GraphQL query to fetch both issues and PRs with timeline data
-    query = """
-    query($owner: String!, $name: String!, $issuesAfter: String, $prsAfter: String) {
-        repository(owner: $owner, name: $name) {
-            issues(first: 25, after: $issuesAfter, orderBy: {field: UPDATED_AT, direction: DESC}) {
-                pageInfo {
-                    hasNextPage
-                    endCursor
-                }
-                nodes {
-                    number
-                    title
-                    url
-                    author {
-                        login
-                    }
-                    createdAt
-                    updatedAt
-                    closedAt
-                    bodyText
-                    state
-                    labels(first: 20) {
-                        nodes {
-                            name
-                        }
-                    }
-                    comments(first: 10, orderBy: {field: UPDATED_AT, direction: DESC}) {
-                        totalCount
-                        nodes {
-                            author {
-                                login
-                            }
-                            bodyText
-                            createdAt
-                            updatedAt
-                        }
-                    }
-                    timelineItems(itemTypes: [ISSUE_COMMENT, LABELED_EVENT, UNLABELED_EVENT, CLOSED_EVENT, REOPENED_EVENT], first: 25) {
-                        nodes {
-                            ... on IssueComment {
-                                createdAt
-                            }
-                            ... on LabeledEvent {
-                                createdAt
-                            }
-                            ... on UnlabeledEvent {
-                                createdAt
-                            }
-                            ... on ClosedEvent {
-                                createdAt
-                            }
-                            ... on ReopenedEvent {
-                                createdAt
-                            }
-                        }
-                    }
-                }
+    Returns two mappings from number to GraphQL node, for issues and PRs.
+    Items that could not be fetched are left out.
+    """
+    items = [("i", number) for number in issue_numbers] + [("p", number) for number in pr_numbers]
+    
+    issues = {}
+    prs = {}
+    for start in range(0, len(items), batch_size):
+        batch = items[start:start + batch_size]
+        
+        # One aliased issue()/pullRequest() field per item: i123, p456, ...
+        fields = "\n".join(
+            f"{kind}{number}: issue(number: {number}) {{ ...IssueDetails }}" if kind == "i"
+            else f"{kind}{number}: pullRequest(number: {number}) {{ ...PullRequestDetails }}"
+            for kind, number in batch
+        )
+        query = (
+            f"query($owner: String!, $name: String!) {{\n"
+            f"repository(owner: $owner, name: $name) {{\n{fields}\n}}\n}}\n"
+            + (ISSUE_DETAIL_FRAGMENT if any(kind == "i" for kind, _ in batch) else "")
+            + (PR_DETAIL_FRAGMENT if any(kind == "p" for kind, _ in batch) else "")
+        )
+        
+        result = fetch_graphql_data(query, {"owner": owner, "name": name}, headers, allow_missing=True)
+        if not result or not result["data"].get("repository"):
+            error(f"Failed to fetch details for {len(batch)} issues and PRs in {owner}/{name}")
+            continue
+        
+        repo_data = result["data"]["repository"]
+        for kind, number in batch:
+            node = repo_data.get(f"{kind}{number}")
+            if node is not None:
+                (issues if kind == "i" else prs)[number] = node
+    
+    return issues, prs
+
+
+# Light queries listing issues and PRs with only their created and updated
+# dates, most recently updated first. Those decide most items; timelines are
+# fetched separately for the rest.
+QUERY_ISSUES = """
+query($owner: String!, $name: String!, $pageSize: Int!, $after: String) {
+    repository(owner: $owner, name: $name) {
+        issues(first: $pageSize, after: $after, orderBy: {field: UPDATED_AT, direction: DESC}) {
+            pageInfo {
+                hasNextPage
+                endCursor
             }
-            pullRequests(first: 25, after: $prsAfter, orderBy: {field: UPDATED_AT, direction: DESC}) {
-                pageInfo {
-                    hasNextPage
-                    endCursor
-                }
-                nodes {
-                    number
-                    title
-                    url
-                    author {
-                        login
-                    }
-                    createdAt
-                    updatedAt
-                    closedAt
-                    mergedAt
-                    bodyText
-                    state
-                    labels(first: 20) {
-                        nodes {
-                            name
-                        }
-                    }
-                    comments(first: 10, orderBy: {field: UPDATED_AT, direction: DESC}) {
-                        totalCount
-                        nodes {
-                            author {
-                                login
-                            }
-                            bodyText
-                            createdAt
-                            updatedAt
-                        }
-                    }
-                    additions
-                    deletions
-                    changedFiles
-                    mergeable
-                    isDraft
-                    timelineItems(itemTypes: [PULL_REQUEST_COMMIT, PULL_REQUEST_REVIEW, ISSUE_COMMENT, MERGED_EVENT, CLOSED_EVENT, REOPENED_EVENT], first: 25) {
-                        nodes {
-                            ... on PullRequestCommit {
-                                commit {
-                                    committedDate
-                                }
-                            }
-                            ... on PullRequestReview {
-                                createdAt
-                            }
-                            ... on IssueComment {
-                                createdAt
-                            }
-                            ... on MergedEvent {
-                                createdAt
-                            }
-                            ... on ClosedEvent {
-                                createdAt
-                            }
-                            ... on ReopenedEvent {
-                                createdAt
-                            }
-                        }
-                    }
+            nodes {
+                number
+                createdAt
+                updatedAt
+            }
+        }
+    }
+}
+"""
+
+QUERY_PRS = """
+query($owner: String!, $name: String!, $pageSize: Int!, $after: String) {
+    repository(owner: $owner, name: $name) {
+        pullRequests(first: $pageSize, after: $after, orderBy: {field: UPDATED_AT, direction: DESC}) {
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+            nodes {
+                number
+                createdAt
+                updatedAt
+            }
+        }
+    }
+}
+"""
+
+# Timeline event dates, for items created before the week and updated after
+# it, which may or may not have had activity in between
+ISSUE_TIMELINE_FRAGMENT = """
+fragment IssueTimeline on Issue {
+    number
+    createdAt
+    updatedAt
+    timelineItems(itemTypes: [ISSUE_COMMENT, LABELED_EVENT, UNLABELED_EVENT, CLOSED_EVENT, REOPENED_EVENT], first: 25) {
+        nodes {
+            ... on IssueComment {
+                createdAt
+            }
+            ... on LabeledEvent {
+                createdAt
+            }
+            ... on UnlabeledEvent {
+                createdAt
+            }
+            ... on ClosedEvent {
+                createdAt
+            }
+            ... on ReopenedEvent {
+                createdAt
+            }
+        }
+    }
+}
+"""
+
+PR_TIMELINE_FRAGMENT = """
+fragment PullRequestTimeline on PullRequest {
+    number
+    createdAt
+    updatedAt
+    timelineItems(itemTypes: [PULL_REQUEST_COMMIT, PULL_REQUEST_REVIEW, ISSUE_COMMENT, MERGED_EVENT, CLOSED_EVENT, REOPENED_EVENT], first: 25) {
+        nodes {
+            ... on PullRequestCommit {
+                commit {
+                    committedDate
                 }
             }
+            ... on PullRequestReview {
+                createdAt
+            }
+            ... on IssueComment {
+                createdAt
+            }
+            ... on MergedEvent {
+                createdAt
+            }
+            ... on ClosedEvent {
+                createdAt
+            }
+            ... on ReopenedEvent {
+                createdAt
+            }
         }
     }
+}
+"""
+
+# Per connection: the field looking up one item by number, and its timeline fragment
+_TIMELINES = {
+    "issues": ("issue", "IssueTimeline", ISSUE_TIMELINE_FRAGMENT),
+    "pullRequests": ("pullRequest", "PullRequestTimeline", PR_TIMELINE_FRAGMENT),
+}
+
+
+def _fetch_timelines(owner: str, name: str, connection: str, numbers: List[int],
+                     headers: Dict[str, str], batch_size: int = 50) -> Dict[int, Dict]:
+    """Fetch timeline dates for issues or PRs by number, many per GraphQL request.
+    
+    Returns a mapping from number to GraphQL node. Items that could not be
+    fetched are left out.
     """
+    field, fragment_name, fragment = _TIMELINES[connection]
+    
+    nodes = {}
+    for start in range(0, len(numbers), batch_size):
+        batch = numbers[start:start + batch_size]
+        
+        # One aliased field per item: n123, n456, ...
+        fields = "\n".join(
+            f"n{number}: {field}(number: {number}) {{ ...{fragment_name} }}" for number in batch
+        )
+        query = (
+            f"query($owner: String!, $name: String!) {{\n"
+            f"repository(owner: $owner, name: $name) {{\n{fields}\n}}\n}}\n{fragment}"
+        )
+        
+        result = fetch_graphql_data(query, {"owner": owner, "name": name}, headers, allow_missing=True)
+        if not result or not result["data"].get("repository"):
+            error(f"Failed to fetch timelines for {len(batch)} {connection} in {owner}/{name}")
+            continue
+        
+        repo_data = result["data"]["repository"]
+        for number in batch:
+            node = repo_data.get(f"n{number}")
+            if node is not None:
+                nodes[number] = node
+    
+    return nodes
 
-    owner, name = repo.split("/")
-    issues = []
-    prs = []
-    good_first_issues = []
 
-    # Fetch all issues and PRs (with pagination if needed)
-    issues_after = None
-    prs_after = None
+def _list_active_numbers(owner: str, name: str, connection: str, query: str, headers: Dict[str, str],
+                         week_start_ts: float, week_end_ts: float) -> Optional[List[int]]:
+    """Page through one connection and return the numbers of items active in the week.
+    
+    Returns None if the repository does not exist.
+    """
+    label = "issues" if connection == "issues" else "PRs"
+    # Numbers of the items active in the week, or possibly so, in listing order
+    active_numbers = []
+    # Items created before the week and updated after it, which need their
+    # timelines checked
+    undecided = []
+    after = None
     page_count = 0
-    max_pages = 20  # Safety limit to prevent infinite loops
     
-    while page_count < max_pages:
+    while True:
         page_count += 1
         variables = {
             "owner": owner,
             "name": name,
-            "issuesAfter": issues_after,
-            "prsAfter": prs_after
+            "pageSize": ISSUES_PAGE_SIZE,
+            "after": after
         }
 
         # Fetch data from GraphQL API
-        info(f"Fetching page {page_count} from GitHub GraphQL API...")
+        _LOG.debug("Fetching %s page %d from GitHub GraphQL API...", label, page_count)
         result = fetch_graphql_data(query, variables, headers)
 
         if not result:
@@ -351,71 +628,109 @@ def fetch_issues(repo: str, token: Optional[str], week_start: datetime, week_end
 
         repo_data = result["data"]["repository"]
         if not repo_data:
-            return [], [], []
-
-        # Process issues
-        issues_data = repo_data.get("issues", {})
-        issue_nodes = issues_data.get("nodes", [])
-        
-        found_issues_this_page = 0
-        for issue in issue_nodes:
-            if has_activity_in_week(issue, week_start, week_end):
-                entry = format_issue_entry(issue)
-                issues.append(entry)
-                found_issues_this_page += 1
-                
-                # Check if it's a good first issue
-                if is_good_first_issue(issue) and issue["state"] == "OPEN":
-                    good_first_issues.append(entry)
+            return None
 
-        # Process PRs
-        prs_data = repo_data.get("pullRequests", {})
-        pr_nodes = prs_data.get("nodes", [])
+        data = repo_data.get(connection) or _EMPTY
+        nodes = data.get("nodes", ())
         
-        found_prs_this_page = 0
-        for pr in pr_nodes:
-            if has_activity_in_week(pr, week_start, week_end):
-                entry = format_pr_entry(pr)
-                prs.append(entry)
-                found_prs_this_page += 1
-
-        # Check if we need to paginate
-        issues_has_next = issues_data.get("pageInfo", {}).get("hasNextPage", False)
-        prs_has_next = prs_data.get("pageInfo", {}).get("hasNextPage", False)
+        found_this_page = 0
+        for node in nodes:
+            if has_activity_in_week(node, week_start_ts, week_end_ts):
+                active_numbers.append(node["number"])
+                found_this_page += 1
+            elif (iso_to_timestamp(node["createdAt"]) < week_start_ts
+                  and iso_to_timestamp(node["updatedAt"]) > week_end_ts):
+                # updatedAt moves on every event, so an item last updated
+                # before the week had no activity in it, and one created after
+                # it cannot have had any; one spanning the week might have
+                active_numbers.append(node["number"])
+                undecided.append(node["number"])
         
-        # Update cursors
-        new_issues_cursor = issues_data.get("pageInfo", {}).get("endCursor")
-        new_prs_cursor = prs_data.get("pageInfo", {}).get("endCursor")
-        
-        # Break if no more pages or if cursors haven't changed
-        if not issues_has_next and not prs_has_next:
-            info(f"Finished pagination after {page_count} pages")
+        _LOG.debug("Page %d: Found %d %s in target week", page_count, found_this_page, label)
+
+        # Check if we need to paginate, and where the next page starts
+        page_info = data.get("pageInfo") or _EMPTY
+        if not page_info.get("hasNextPage", False):
             break
         
-        if issues_has_next and new_issues_cursor == issues_after:
-            info("Issues cursor unchanged, breaking pagination")
+        # Items come most recently updated first, so once a page holds one
+        # last updated before the week, no later page can have activity in it
+        if nodes and min(iso_to_timestamp(n["updatedAt"]) for n in nodes) < week_start_ts:
             break
-        if prs_has_next and new_prs_cursor == prs_after:
-            info("PRs cursor unchanged, breaking pagination")
-            break
-            
-        # Update cursors for next iteration
-        if issues_has_next:
-            issues_after = new_issues_cursor
-        else:
-            issues_after = None
-            
-        if prs_has_next:
-            prs_after = new_prs_cursor
-        else:
-            prs_after = None
-        
-        info(f"Page {page_count}: Found {found_issues_this_page} issues and {found_prs_this_page} PRs in target week")
         
-        # Early termination if we're not finding relevant activity
-        if page_count > 5 and found_issues_this_page == 0 and found_prs_this_page == 0:
-            info(f"No activity found in recent pages, stopping at page {page_count}")
+        new_cursor = page_info.get("endCursor")
+        if new_cursor == after:
+            _LOG.debug("%s cursor unchanged, breaking pagination", label.capitalize())
             break
+        after = new_cursor
+    
+    _LOG.debug("Finished %s pagination after %d pages", label, page_count)
+    
+    # Keep the undecided items whose timelines show activity in the week
+    if undecided:
+        timelines = _fetch_timelines(owner, name, connection, list(dict.fromkeys(undecided)), headers)
+        inactive = {
+            number for number in undecided
+            if number not in timelines or not has_activity_in_week(timelines[number], week_start_ts, week_end_ts)
+        }
+        active_numbers = [number for number in active_numbers if number not in inactive]
+    
+    # An item updated while we were paginating can be listed twice
+    return list(dict.fromkeys(active_numbers))
+
+
+def fetch_issues(repo: str, token: Optional[str], week_start: datetime, week_end: datetime) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+    """Fetch issues and PRs from a repository for a specific week using GraphQL.
+    
+    Issues and PRs are listed concurrently, each with its own light query
+    carrying only the dates needed to decide whether an item was active in
+    the week. Full details (bodies, labels, comments) are then fetched just
+    for the active items.
+    """
+    headers = {"Content-Type": "application/json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+
+    owner, name = repo.split("/")
+    issues = []
+    prs = []
+    good_first_issues = []
+
+    # Compare activity dates against the week as plain numbers
+    week_start_ts = week_start.timestamp()
+    week_end_ts = week_end.timestamp()
+
+    # Page through issues and PRs side by side, each connection following
+    # its own cursor until it has nothing more for this week
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        issues_future = executor.submit(_list_active_numbers, owner, name, "issues", QUERY_ISSUES,
+                                        headers, week_start_ts, week_end_ts)
+        prs_future = executor.submit(_list_active_numbers, owner, name, "pullRequests", QUERY_PRS,
+                                     headers, week_start_ts, week_end_ts)
+        active_issue_numbers = issues_future.result()
+        active_pr_numbers = prs_future.result()
+    
+    if active_issue_numbers is None or active_pr_numbers is None:
+        return [], [], []
+
+    # Fetch full details for the active items
+    issue_details, pr_details = fetch_issue_details(owner, name, active_issue_numbers, active_pr_numbers, headers)
+    
+    for number in active_issue_numbers:
+        issue = issue_details.get(number)
+        if issue is None:
+            continue
+        entry = format_issue_entry(issue)
+        issues.append(entry)
+        
+        # Check if it's a good first issue
+        if is_good_first_issue(issue) and issue["state"] == "OPEN":
+            good_first_issues.append(entry)
+    
+    for number in active_pr_numbers:
+        pr = pr_details.get(number)
+        if pr is not None:
+            prs.append(format_pr_entry(pr))
 
     info(f"Total: {len(issues)} issues, {len(prs)} PRs, {len(good_first_issues)} good first issues found")
     
@@ -423,17 +738,28 @@ def fetch_issues(repo: str, token: Optional[str], week_start: datetime, week_end
 
 
 def fetch_user_info(username: str, token: Optional[str]) -> Optional[Dict[str, Any]]:
-    """Fetch detailed user information from GitHub API."""
-    headers = {"Accept": "application/vnd.github.v3+json"}
+    """Fetch detailed user information from GitHub API.
+    
+    With a token this is a single-user fetch_users_batch lookup; callers with
+    many users should use fetch_users_batch directly. Without one (GraphQL
+    requires a token) the REST endpoint is used.
+    """
     if token:
-        headers["Authorization"] = f"token {token}"
+        users = fetch_users_batch([username], token)
+        if username not in users:
+            error(f"Failed to fetch user {username}")
+            return None
+        if users[username] is None:
+            warning(f"User {username} not found")
+        return users[username]
     
+    headers = {"Accept": "application/vnd.github.v3+json"}
     url = f"https://api.github.com/users/{username}"
     
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response, user_data = _get_json_with_etag(url, headers, timeout=10)
         if response.status_code == 200:
-            return response.json()
+            return user_data
         elif response.status_code == 403:
             # Handle rate limiting
             rate_limit_remaining = response.headers.get('X-RateLimit-Remaining')
@@ -448,150 +774,423 @@ def fetch_user_info(username: str, token: Optional[str]) -> Optional[Dict[str, A
         else:
             error(f"Error fetching user {username}: {response.status_code}")
             return None
-    except requests.RequestException as e:
+    except (requests.RequestException, jsonio.JSONDecodeError) as e:
         error(f"Failed to fetch user {username}: {e}")
         return None
 
 
+# Profile fields for a user or organization, matching what the REST
+# /users/{username} endpoint returns for either
+USER_FRAGMENT = """
+fragment OwnerDetails on RepositoryOwner {
+    __typename
+    login
+    url
+    avatarUrl
+    repositories(privacy: PUBLIC, ownerAffiliations: [OWNER]) {
+        totalCount
+    }
+    ... on User {
+        databaseId
+        name
+        bio
+        company
+        location
+        websiteUrl
+        twitterUsername
+        createdAt
+        followers {
+            totalCount
+        }
+        following {
+            totalCount
+        }
+    }
+    ... on Organization {
+        databaseId
+        name
+        description
+        location
+        websiteUrl
+        twitterUsername
+        createdAt
+    }
+}
+"""
+
+
+def _rest_user(owner: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a GraphQL OwnerDetails node into REST /users/{username} shape."""
+    return {
+        "login": owner["login"],
+        "id": owner.get("databaseId"),
+        "type": owner.get("__typename"),
+        "name": owner.get("name"),
+        "html_url": owner.get("url"),
+        "avatar_url": owner.get("avatarUrl"),
+        "bio": owner.get("bio", owner.get("description")),
+        "company": owner.get("company"),
+        "location": owner.get("location"),
+        "blog": owner.get("websiteUrl") or "",
+        "twitter_username": owner.get("twitterUsername"),
+        "public_repos": owner.get("repositories", {}).get("totalCount", 0),
+        "followers": owner.get("followers", {}).get("totalCount", 0),
+        "following": owner.get("following", {}).get("totalCount", 0),
+        "created_at": owner.get("createdAt"),
+    }
+
+
+def fetch_users_batch(usernames: List[str], token: Optional[str], batch_size: int = 100) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Fetch many users per GraphQL request using aliased owner lookups.
+    
+    Returns a mapping from username to REST-style user data (login, name,
+    html_url, avatar_url, bio, company, location, blog, public_repos,
+    followers, created_at, ...), or None for users that do not exist.
+    Organizations resolve too, as they do on the REST endpoint. Usernames
+    whose lookup failed are left out of the result.
+    """
+    headers = {"Content-Type": "application/json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    
+    users = {}
+    for start in range(0, len(usernames), batch_size):
+        batch = usernames[start:start + batch_size]
+        
+        # One aliased repositoryOwner() field per login: u0, u1, ...
+        params = ", ".join(f"$u{i}: String!" for i in range(len(batch)))
+        fields = "\n".join(
+            f"u{i}: repositoryOwner(login: $u{i}) {{ ...OwnerDetails }}"
+            for i in range(len(batch))
+        )
+        query = f"query({params}) {{\n{fields}\n}}\n{USER_FRAGMENT}"
+        variables = {f"u{i}": username for i, username in enumerate(batch)}
+        
+        # Retried through rate limits; missing users come back as null aliases
+        result = fetch_graphql_data(query, variables, headers, allow_missing=True)
+        if not result:
+            error(f"Failed to fetch {len(batch)} users")
+            continue
+        data = result["data"]
+        
+        # Missing users come back as NOT_FOUND errors; anything else is a failure
+        failed = {
+            graphql_error["path"][0]
+            for graphql_error in result.get("errors") or []
+            if graphql_error.get("type") != "NOT_FOUND" and graphql_error.get("path")
+        }
+        
+        for i, username in enumerate(batch):
+            alias = f"u{i}"
+            if alias in failed or alias not in data:
+                continue
+            owner = data[alias]
+            users[username] = _rest_user(owner) if owner is not None else None
+    
+    return users
+
+
+def _format_release(release: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a REST release response into the expected format."""
+    return {
+        "tag_name": release.get("tag_name"),
+        "name": release.get("name"),
+        "published_at": release.get("published_at"),
+        "author": release.get("author", {}).get("login") if release.get("author") else None,
+        "html_url": release.get("html_url"),
+        "body": release.get("body", ""),
+        "prerelease": release.get("prerelease", False),
+        "draft": release.get("draft", False),
+        "assets": [
+            {
+                "name": asset.get("name"),
+                "download_count": asset.get("download_count", 0),
+                "size": asset.get("size", 0)
+            }
+            for asset in release.get("assets", [])
+        ]
+    }
+
+
 def fetch_releases(repo_name: str, token: Optional[str], week_start: datetime, week_end: datetime) -> List[Dict[str, Any]]:
-    """Fetch releases from a GitHub repository for a specific week."""
+    """Fetch releases from a GitHub repository for a specific week.
+    
+    The first page is fetched on its own, as it usually reaches back past the
+    week. When it does not, the remaining pages (known from the Link header)
+    are requested a few at a time ahead of the one being read, stopping once
+    a page ends before the week.
+    """
     owner, name = repo_name.split("/")
     
     headers = {"Accept": "application/vnd.github.v3+json"}
     if token:
         headers["Authorization"] = f"token {token}"
     
-    releases = []
-    page = 1
+    url = f"https://api.github.com/repos/{owner}/{name}/releases"
     per_page = 100
+    max_pages = 10  # Safety limit
     
-    while page <= 10:  # Safety limit
-        url = f"https://api.github.com/repos/{owner}/{name}/releases"
+    def fetch_page(page: int) -> Tuple[requests.Response, Any]:
         params = {
             "per_page": per_page,
             "page": page
         }
-        
-        try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            if response.status_code == 200:
-                page_releases = response.json()
-                
-                if not page_releases:
-                    break
-                
-                # Filter releases by date
-                for release in page_releases:
-                    published_at = release.get("published_at")
-                    if published_at and is_in_week_range(published_at, week_start, week_end):
-                        # Format release data
-                        formatted_release = {
-                            "tag_name": release.get("tag_name"),
-                            "name": release.get("name"),
-                            "published_at": published_at,
-                            "author": release.get("author", {}).get("login") if release.get("author") else None,
-                            "html_url": release.get("html_url"),
-                            "body": release.get("body", ""),
-                            "prerelease": release.get("prerelease", False),
-                            "draft": release.get("draft", False),
-                            "assets": [
-                                {
-                                    "name": asset.get("name"),
-                                    "download_count": asset.get("download_count", 0),
-                                    "size": asset.get("size", 0)
-                                }
-                                for asset in release.get("assets", [])
-                            ]
-                        }
-                        releases.append(formatted_release)
-                
-                # Check if we've gone past our date range
-                if page_releases:
-                    last_release_date = page_releases[-1].get("published_at")
-                    if last_release_date:
-                        last_date = datetime.fromisoformat(last_release_date.replace("Z", "+00:00"))
-                        if last_date < week_start:
-                            break
-                
-                page += 1
-            elif response.status_code == 403:
-                # Handle rate limiting
-                rate_limit_remaining = response.headers.get('X-RateLimit-Remaining')
-                if rate_limit_remaining == '0':
-                    error(f"Rate limit exceeded when fetching releases for {repo_name}")
-                else:
-                    error(f"HTTP 403: Access forbidden for {repo_name}. Check token permissions.")
-                break
+        return _get_json_with_etag(url, headers, params=params, timeout=10)
+    
+    releases = []
+    
+    def process_page(page_result: Tuple[requests.Response, Any]) -> bool:
+        """Collect the page's releases in the week; return whether to read on."""
+        response, page_releases = page_result
+        if response.status_code == 403:
+            # Handle rate limiting
+            rate_limit_remaining = response.headers.get('X-RateLimit-Remaining')
+            if rate_limit_remaining == '0':
+                error(f"Rate limit exceeded when fetching releases for {repo_name}")
             else:
-                warning(f"Failed to fetch releases for {repo_name}: {response.status_code}")
-                break
-                
-        except requests.RequestException as e:
-            error(f"Error fetching releases for {repo_name}: {e}")
-            break
+                error(f"HTTP 403: Access forbidden for {repo_name}. Check token permissions.")
+            return False
+        elif response.status_code != 200:
+            warning(f"Failed to fetch releases for {repo_name}: {response.status_code}")
+            return False
+        
+        if not page_releases:
+            return False
+        
+        # Filter releases by date, checking the whole page at once
+        in_week = filter_in_week_range(
+            [release.get("published_at") for release in page_releases], week_start, week_end
+        )
+        for release, release_in_week in zip(page_releases, in_week):
+            if release_in_week:
+                releases.append(_format_release(release))
+        
+        # Releases come newest first, so stop once a page ends before the week
+        last_release_date = page_releases[-1].get("published_at")
+        if last_release_date and iso_to_timestamp(last_release_date) < week_start.timestamp():
+            return False
+        return True
+    
+    try:
+        first_page = fetch_page(1)
+        first_response = first_page[0]
+        if process_page(first_page) and "last" in first_response.links:
+            last_url = first_response.links["last"]["url"]
+            last_page = min(max_pages, int(parse_qs(urlparse(last_url).query)["page"][0]))
+            
+            # Keep a few pages in flight ahead of the one being read; any more
+            # would mostly be wasted requests once we pass the week
+            pages = iter(range(2, last_page + 1))
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                pending = deque(executor.submit(fetch_page, page) for page in islice(pages, 3))
+                while pending and process_page(pending.popleft().result()):
+                    next_page = next(pages, None)
+                    if next_page is not None:
+                        pending.append(executor.submit(fetch_page, next_page))
+    except (requests.RequestException, jsonio.JSONDecodeError) as e:
+        error(f"Error fetching releases for {repo_name}: {e}")
     
     info(f"Found {len(releases)} releases for {repo_name} in week")
     return releases
 
 
+# Common words that appear after @ but aren't usernames
+_COMMON_WORDS = frozenset({
+    "ghost", "Anonymous", "github-actions", "github",
+    "test", "check", "lint", "doc", "all", "empty", "echo",
+    "author", "users", "default", "deprecated", "disable",
+    "builtin", "invalid", "immediate", "master", "main",
+    "raise", "return", "import", "export", "static", "dynamic",
+    "inline", "implicit", "explicit", "param", "params",
+    "option", "options", "support", "install", "uninstall",
+    "build", "compile", "run", "exec", "execute", "start", "stop",
+    "enable", "true", "false", "yes", "no",
+    "foo", "bar", "baz", "example", "sample", "demo",
+    "todo", "fixme", "note", "warning", "error", "info",
+    "debug", "release", "production", "development", "staging",
+    "local", "remote", "origin", "upstream", "downstream",
+    "entry", "exit", "init", "cleanup", "setup", "teardown",
+    "begin", "end", "open", "close", "read", "write",
+    "get", "set", "add", "remove", "delete", "update",
+    "list", "lists", "array", "arrays", "map", "maps",
+    "string", "strings", "number", "numbers", "bool", "boolean",
+    "int", "integer", "float", "double", "char", "character",
+    "byte", "bytes", "bit", "bits", "size", "length",
+    "count", "total", "sum", "average", "min", "max",
+    "first", "last", "next", "prev", "previous", "current",
+    "new", "old", "temp", "tmp", "cache", "buffer",
+    "input", "output", "result", "results", "value", "values",
+    "key", "keys", "item", "items", "element", "elements",
+    "node", "nodes", "edge", "edges", "graph", "tree",
+    "root", "leaf", "parent", "child", "children", "sibling",
+    "copy", "move", "rename", "replace", "swap", "merge",
+    "split", "join", "concat", "append", "prepend", "insert",
+    "push", "pop", "shift", "unshift", "slice", "splice",
+    "filter", "reduce", "fold", "scan", "zip",
+    "sort", "reverse", "shuffle", "unique", "distinct", "group",
+    "match", "search", "find", "regex", "pattern",
+    "format", "parse", "encode", "decode", "encrypt", "decrypt",
+    "hash", "sign", "verify", "validate", "sanitize", "escape",
+    "serialize", "deserialize", "marshal", "unmarshal", "pack", "unpack",
+    "compress", "decompress", "unzip", "tar", "untar",
+    "upload", "download", "fetch", "pull", "sync",
+    "send", "receive", "request", "response", "reply", "forward",
+    "connect", "disconnect", "bind", "unbind", "listen", "accept",
+    "seek", "tell",
+    "lock", "unlock", "acquire", "wait", "notify",
+    "pause", "resume", "cancel", "abort",
+    "create", "destroy", "alloc", "free", "malloc", "calloc",
+    "realloc", "dealloc", "construct", "destruct",
+    "initialize", "finalize", "register", "unregister", "subscribe", "unsubscribe",
+    "attach", "detach", "mount", "unmount", "load", "unload",
+    "include", "exclude", "require", "module",
+    "package", "library", "framework", "plugin", "extension", "addon",
+    "config", "configure", "settings", "preferences", "flags",
+    "version", "patch", "major", "minor", "micro",
+    "alpha", "beta", "gamma", "delta", "epsilon", "zeta",
+    "public", "private", "protected", "internal", "external", "global",
+    "const", "final", "abstract", "virtual", "override",
+    "interface", "class", "struct", "enum", "union", "typedef",
+    "namespace", "using", "alias", "template", "generic", "trait",
+    "function", "method", "procedure", "routine", "callback", "handler",
+    "event", "signal", "slot", "delegate", "lambda", "closure",
+    "async", "await", "promise", "future", "task", "thread",
+    "process", "job", "worker", "pool", "queue", "stack",
+    "heap", "store", "storage", "memory",
+    "disk", "file", "folder", "directory", "path", "url",
+    "uri", "urn", "uuid", "guid", "id", "uid",
+    "name", "label", "title", "description", "summary", "details",
+    "content", "body", "header", "footer", "sidebar", "nav",
+    "menu", "toolbar", "statusbar", "panel", "dialog", "modal",
+    "button", "link", "form", "field",
+    "table", "row", "column", "cell", "grid", "layout",
+    "view", "model", "controller", "component", "widget",
+    "page", "screen", "window", "frame", "layer", "canvas",
+    "image", "icon", "sprite", "texture", "shader", "mesh",
+    "sound", "audio", "video", "media", "stream", "player",
+    "server", "client", "host", "guest", "peer",
+    "network", "socket", "port", "protocol", "packet", "message",
+    "query", "command", "action", "operation",
+    "transaction", "session", "context", "scope", "environment", "state",
+    "data", "metadata", "schema", "index",
+    "record", "tuple", "relation",
+    "database", "collection", "document", "object", "entity",
+    "repository", "service", "provider", "factory", "builder", "manager",
+    "helper", "utility", "tool", "lib", "core", "base",
+    "common", "shared", "system", "platform",
+    "application", "app", "program", "software",
+    "fix", "hotfix", "bugfix", "feature", "enhancement", "improvement",
+    "refactor", "optimize", "performance", "security", "stability", "reliability",
+    "compatibility", "portability", "scalability", "flexibility", "extensibility", "maintainability",
+    "usability", "accessibility", "internationalization", "localization", "translation", "documentation",
+    "comment", "hack", "workaround",
+    "obsolete", "legacy", "experimental", "unstable",
+    "tag", "branch", "commit",
+    "rebase", "cherry-pick", "revert", "reset", "stash", "apply",
+    "diff", "blame", "log", "status",
+    "clone", "fork",
+    "develop",
+    # OCaml-specific common words
+    "type", "sig", "functor", "val",
+    "let", "in", "rec", "and", "or", "not",
+    "if", "then", "else", "with", "when",
+    "fun", "try", "exception",
+    "do", "done", "for", "while",
+    "to", "downto", "of", "as", "ref", "mutable",
+    "inherit", "initializer", "constraint",
+    "lazy", "assert", "nonrec",
+    # Common version-like strings
+    "v1", "v2", "v3", "v4", "v5", "v30", "v31",
+    # Build/test related
+    "runtest", "runtest-js", "runtest-a", "runtest-name",
+    "make", "cmake",
+    # Package managers
+    "npm", "pip", "gem", "cargo", "opam", "dune",
+    # OS/platforms
+    "linux", "windows", "macos", "unix", "posix", "win32",
+    "ubuntu", "debian", "fedora", "centos", "rhel", "arch",
+    # Common tools
+    "git", "svn", "hg", "cvs", "bzr", "perforce",
+    "gcc", "clang", "msvc", "icc", "llvm", "mingw",
+    "autoconf", "automake", "libtool", "pkg-config",
+    # Email providers (sometimes appear in broken mentions)
+    "gmail", "outlook", "yahoo", "hotmail", "protonmail", "icloud",
+    # Common test/example names
+    "qux", "quux", "corge",
+    "alice", "bob", "charlie", "dave", "eve", "frank",
+    # Database-related
+    "mysql", "postgresql", "sqlite", "mongodb", "redis", "cassandra",
+    # Other common technical terms
+    "api", "sdk", "cli", "gui", "ui", "ux",
+    "http", "https", "ftp", "ssh", "ssl", "tls",
+    "json", "xml", "yaml", "toml", "ini", "csv",
+    "utf8", "utf16", "ascii", "unicode", "base64", "hex",
+    "md5", "sha1", "sha256", "sha512", "crc32", "xxhash",
+    # Short common words
+    "a", "an", "the", "is", "are", "was", "were",
+    "be", "been", "being", "have", "has", "had",
+    "does", "did", "will", "would", "should",
+    "could", "may", "might", "must", "can", "cannot",
+    "it", "its", "this", "that", "these", "those",
+    "my", "your", "his", "her", "our", "their",
+    "i", "you", "he", "she", "we", "they",
+    "me", "him", "us", "them", "myself",
+    "at", "by", "from",
+    "on", "about", "after", "before",
+    "up", "down", "out", "off", "over", "under",
+    # OCaml-specific modules/libraries  
+    "fmt", "lwt", "stdio",
+    "hashtbl", "weak",
+    "gc", "sys", "mutex", "condition",
+    "random", "complex", "bigarray", "dynlink", "str",
+    "graphics", "dbm", "labltk", "camlp4", "camlp5", "ppx",
+    # Common patterns that look like usernames but aren't
+    "regalloc", "docalias", "pkg-lock", "pkg-install",
+    "ocaml-index", "untaged", "untagged", "tangled",
+    "cold", "hot", "warm", "cool", "recoil", "specialise",
+    "hilbert", "thor", "jane",
+    "sita", "pop-os",
+    # Specific non-usernames seen in the data
+    "anthropic", "janestreet", "ocamlpro", "ocaml",
+    "XYZ", "ABC", "TODO", "FIXME", "XXX", "HACK",
+    "GLIBC", "POSIX", "ISO", "ANSI", "IEEE",
+    # Common prefixes/suffixes that might appear
+    "latest",
+})
+
+
+# Names that can be usernames: starting with a letter, at least two characters
+# long, and not hex-like (e.g., "d87a1eb", "fe8872fd7ead" are commit SHA
+# fragments). Comment authors such as "dependabot[bot]" are kept.
+_VALID_USER_PATTERN = re.compile(r'(?![0-9a-fA-F]+$)[^\W\d_].', re.DOTALL)
+
+
 def extract_users_from_data(issues: List[Dict], prs: List[Dict], discussions: List[Dict]) -> set:
     """Extract unique usernames from issues, PRs, discussions, and all @mentions in comments."""
-    import re
     users = set()
     
-    # Pattern to match @mentions - must start with a letter and can contain letters, numbers, and hyphens
-    # This avoids matching things like @15 or @21 which are likely line numbers
-    mention_pattern = re.compile(r'@([a-zA-Z][a-zA-Z0-9-]{0,38})')
+    # Text to scan for @mentions, searched in one pass once everything is collected
+    texts = []
     
-    # Extract from issues
-    for issue in issues:
-        if issue.get("user"):
-            users.add(issue["user"])
+    # Extract from issues and PRs
+    for item in (*issues, *prs):
+        if item.get("user"):
+            users.add(item["user"])
         
-        # Extract from issue body
-        if issue.get("body"):
-            mentions = mention_pattern.findall(issue["body"])
-            users.update(mentions)
+        # Extract from issue/PR body
+        if item.get("body"):
+            texts.append(item["body"])
         
         # Extract from comments
-        for comment in issue.get("comments", []):
+        for comment in item.get("comments", []):
             # Extract comment author (format: "@author: text")
             if comment.startswith("@"):
-                parts = comment.split(":", 1)
-                if len(parts) >= 1:
-                    username = parts[0][1:].strip()  # Remove @ and get username before colon
-                    # Validate it's a proper username (starts with letter)
-                    if username and username[0].isalpha():
-                        users.add(username)
+                username = comment[1:].partition(":")[0].strip()  # Username before colon
+                # Validate it's a proper username (starts with letter)
+                if username and username[0].isalpha():
+                    users.add(username)
             
-            # Extract all @mentions within the comment text
-            mentions = mention_pattern.findall(comment)
-            users.update(mentions)
-    
-    # Extract from PRs
-    for pr in prs:
-        if pr.get("user"):
-            users.add(pr["user"])
-        
-        # Extract from PR body
-        if pr.get("body"):
-            mentions = mention_pattern.findall(pr["body"])
-            users.update(mentions)
-        
-        # Extract from comments
-        for comment in pr.get("comments", []):
-            # Extract comment author (format: "@author: text")
-            if comment.startswith("@"):
-                parts = comment.split(":", 1)
-                if len(parts) >= 1:
-                    username = parts[0][1:].strip()  # Remove @ and get username before colon
-                    # Validate it's a proper username (starts with letter)
-                    if username and username[0].isalpha():
-                        users.add(username)
-            
-            # Extract all @mentions within the comment text
-            mentions = mention_pattern.findall(comment)
-            users.update(mentions)
+            texts.append(comment)
     
     # Extract from discussions
     for discussion in discussions:
@@ -600,196 +1199,18 @@ def extract_users_from_data(issues: List[Dict], prs: List[Dict], discussions: Li
         
         # Extract from discussion body
         if discussion.get("body"):
-            mentions = mention_pattern.findall(discussion["body"])
-            users.update(mentions)
-    
-    # Common words that appear after @ but aren't usernames
-    common_words = {
-        "ghost", "Anonymous", "github-actions", "github",
-        "test", "check", "lint", "doc", "all", "empty", "echo",
-        "author", "users", "default", "deprecated", "disable",
-        "builtin", "invalid", "immediate", "master", "main",
-        "raise", "return", "import", "export", "static", "dynamic",
-        "inline", "implicit", "explicit", "param", "params",
-        "option", "options", "support", "install", "uninstall",
-        "build", "compile", "run", "exec", "execute", "start", "stop",
-        "enable", "disable", "true", "false", "yes", "no",
-        "foo", "bar", "baz", "example", "sample", "demo",
-        "todo", "fixme", "note", "warning", "error", "info",
-        "debug", "release", "production", "development", "staging",
-        "local", "remote", "origin", "upstream", "downstream",
-        "entry", "exit", "init", "cleanup", "setup", "teardown",
-        "begin", "end", "open", "close", "read", "write",
-        "get", "set", "add", "remove", "delete", "update",
-        "list", "lists", "array", "arrays", "map", "maps",
-        "string", "strings", "number", "numbers", "bool", "boolean",
-        "int", "integer", "float", "double", "char", "character",
-        "byte", "bytes", "bit", "bits", "size", "length",
-        "count", "total", "sum", "average", "min", "max",
-        "first", "last", "next", "prev", "previous", "current",
-        "new", "old", "temp", "tmp", "cache", "buffer",
-        "input", "output", "result", "results", "value", "values",
-        "key", "keys", "item", "items", "element", "elements",
-        "node", "nodes", "edge", "edges", "graph", "tree",
-        "root", "leaf", "parent", "child", "children", "sibling",
-        "copy", "move", "rename", "replace", "swap", "merge",
-        "split", "join", "concat", "append", "prepend", "insert",
-        "push", "pop", "shift", "unshift", "slice", "splice",
-        "filter", "map", "reduce", "fold", "scan", "zip",
-        "sort", "reverse", "shuffle", "unique", "distinct", "group",
-        "match", "search", "find", "replace", "regex", "pattern",
-        "format", "parse", "encode", "decode", "encrypt", "decrypt",
-        "hash", "sign", "verify", "validate", "sanitize", "escape",
-        "serialize", "deserialize", "marshal", "unmarshal", "pack", "unpack",
-        "compress", "decompress", "zip", "unzip", "tar", "untar",
-        "upload", "download", "fetch", "pull", "push", "sync",
-        "send", "receive", "request", "response", "reply", "forward",
-        "connect", "disconnect", "bind", "unbind", "listen", "accept",
-        "open", "close", "read", "write", "seek", "tell",
-        "lock", "unlock", "acquire", "release", "wait", "notify",
-        "start", "stop", "pause", "resume", "cancel", "abort",
-        "create", "destroy", "alloc", "free", "malloc", "calloc",
-        "realloc", "dealloc", "new", "delete", "construct", "destruct",
-        "initialize", "finalize", "register", "unregister", "subscribe", "unsubscribe",
-        "attach", "detach", "mount", "unmount", "load", "unload",
-        "include", "exclude", "require", "import", "export", "module",
-        "package", "library", "framework", "plugin", "extension", "addon",
-        "config", "configure", "settings", "preferences", "options", "flags",
-        "version", "release", "patch", "major", "minor", "micro",
-        "alpha", "beta", "gamma", "delta", "epsilon", "zeta",
-        "public", "private", "protected", "internal", "external", "global",
-        "static", "const", "final", "abstract", "virtual", "override",
-        "interface", "class", "struct", "enum", "union", "typedef",
-        "namespace", "using", "alias", "template", "generic", "trait",
-        "function", "method", "procedure", "routine", "callback", "handler",
-        "event", "signal", "slot", "delegate", "lambda", "closure",
-        "async", "await", "promise", "future", "task", "thread",
-        "process", "job", "worker", "pool", "queue", "stack",
-        "heap", "buffer", "cache", "store", "storage", "memory",
-        "disk", "file", "folder", "directory", "path", "url",
-        "uri", "urn", "uuid", "guid", "id", "uid",
-        "name", "label", "title", "description", "summary", "details",
-        "content", "body", "header", "footer", "sidebar", "nav",
-        "menu", "toolbar", "statusbar", "panel", "dialog", "modal",
-        "button", "link", "input", "output", "form", "field",
-        "table", "row", "column", "cell", "grid", "layout",
-        "view", "model", "controller", "component", "widget", "element",
-        "page", "screen", "window", "frame", "layer", "canvas",
-        "image", "icon", "sprite", "texture", "shader", "mesh",
-        "sound", "audio", "video", "media", "stream", "player",
-        "server", "client", "host", "guest", "peer", "node",
-        "network", "socket", "port", "protocol", "packet", "message",
-        "request", "response", "query", "command", "action", "operation",
-        "transaction", "session", "context", "scope", "environment", "state",
-        "data", "metadata", "schema", "table", "index", "key",
-        "record", "field", "column", "row", "tuple", "relation",
-        "database", "collection", "document", "object", "entity", "model",
-        "repository", "service", "provider", "factory", "builder", "manager",
-        "helper", "utility", "tool", "lib", "core", "base",
-        "common", "shared", "global", "system", "platform", "framework",
-        "application", "app", "program", "software", "package", "module",
-        "component", "plugin", "extension", "addon", "patch", "update",
-        "fix", "hotfix", "bugfix", "feature", "enhancement", "improvement",
-        "refactor", "optimize", "performance", "security", "stability", "reliability",
-        "compatibility", "portability", "scalability", "flexibility", "extensibility", "maintainability",
-        "usability", "accessibility", "internationalization", "localization", "translation", "documentation",
-        "comment", "note", "todo", "fixme", "hack", "workaround",
-        "deprecated", "obsolete", "legacy", "experimental", "unstable", "beta",
-        "release", "version", "tag", "branch", "commit", "merge",
-        "rebase", "cherry-pick", "revert", "reset", "stash", "apply",
-        "diff", "patch", "blame", "log", "status", "config",
-        "clone", "fork", "pull", "push", "fetch", "remote",
-        "upstream", "downstream", "origin", "master", "main", "develop",
-        "feature", "bugfix", "hotfix", "release", "tag", "branch",
-        # OCaml-specific common words
-        "type", "module", "sig", "struct", "functor", "val",
-        "let", "in", "rec", "and", "or", "not",
-        "if", "then", "else", "match", "with", "when",
-        "fun", "function", "try", "with", "exception", "raise",
-        "begin", "end", "do", "done", "for", "while",
-        "to", "downto", "of", "as", "ref", "mutable",
-        "open", "include", "module", "type", "class", "object",
-        "method", "inherit", "initializer", "constraint", "virtual", "private",
-        "lazy", "assert", "external", "rec", "nonrec", "and",
-        # Common version-like strings
-        "v1", "v2", "v3", "v4", "v5", "v30", "v31",
-        # Build/test related
-        "runtest", "runtest-js", "runtest-a", "runtest-name",
-        "build", "make", "cmake", "configure", "install",
-        # Package managers
-        "npm", "pip", "gem", "cargo", "opam", "dune",
-        # OS/platforms
-        "linux", "windows", "macos", "unix", "posix", "win32",
-        "ubuntu", "debian", "fedora", "centos", "rhel", "arch",
-        # Common tools
-        "git", "svn", "hg", "cvs", "bzr", "perforce",
-        "gcc", "clang", "msvc", "icc", "llvm", "mingw",
-        "make", "cmake", "autoconf", "automake", "libtool", "pkg-config",
-        # Email providers (sometimes appear in broken mentions)
-        "gmail", "outlook", "yahoo", "hotmail", "protonmail", "icloud",
-        # Common test/example names
-        "foo", "bar", "baz", "qux", "quux", "corge",
-        "alice", "bob", "charlie", "dave", "eve", "frank",
-        # Database-related
-        "mysql", "postgresql", "sqlite", "mongodb", "redis", "cassandra",
-        # Other common technical terms
-        "api", "sdk", "cli", "gui", "ui", "ux",
-        "http", "https", "ftp", "ssh", "ssl", "tls",
-        "json", "xml", "yaml", "toml", "ini", "csv",
-        "utf8", "utf16", "ascii", "unicode", "base64", "hex",
-        "md5", "sha1", "sha256", "sha512", "crc32", "xxhash",
-        # Short common words
-        "a", "an", "the", "is", "are", "was", "were",
-        "be", "been", "being", "have", "has", "had",
-        "do", "does", "did", "will", "would", "should",
-        "could", "may", "might", "must", "can", "cannot",
-        "it", "its", "this", "that", "these", "those",
-        "my", "your", "his", "her", "our", "their",
-        "i", "you", "he", "she", "we", "they",
-        "me", "him", "her", "us", "them", "myself",
-        "at", "by", "for", "from", "in", "of",
-        "on", "to", "with", "about", "after", "before",
-        "up", "down", "out", "off", "over", "under",
-        # OCaml-specific modules/libraries  
-        "fmt", "lwt", "async", "core", "base", "stdio",
-        "list", "array", "string", "bytes", "buffer", "queue",
-        "stack", "heap", "set", "map", "hashtbl", "weak",
-        "gc", "sys", "unix", "thread", "mutex", "condition",
-        "event", "random", "complex", "bigarray", "dynlink", "str",
-        "graphics", "dbm", "labltk", "camlp4", "camlp5", "ppx",
-        # Common patterns that look like usernames but aren't
-        "regalloc", "docalias", "pkg-lock", "pkg-install", 
-        "ocaml-index", "untaged", "untagged", "tangled",
-        "cold", "hot", "warm", "cool", "recoil", "specialise",
-        "hilbert", "thor", "jane", "alice", "bob",
-        "sita", "fedora", "pop-os", "ubuntu", "debian",
-        # Specific non-usernames seen in the data
-        "anthropic", "janestreet", "ocamlpro", "ocaml",
-        "XYZ", "ABC", "TODO", "FIXME", "XXX", "HACK",
-        "GLIBC", "POSIX", "ISO", "ANSI", "IEEE",
-        # Common prefixes/suffixes that might appear
-        "latest", "current", "previous", "next", "first", "last"
-    }
+            texts.append(discussion["body"])
     
-    # Remove invalid usernames
-    users = users - common_words
-    users.discard("")  # Remove empty strings
-    
-    # Additional validation: remove usernames that don't start with a letter
-    # and remove hex-like strings (e.g., "d87a1eb", "fe8872fd7ead")
-    import re
-    hex_pattern = re.compile(r'^[a-f0-9]+$')
+    # Extract all @mentions; the separator cannot be part of a mention
+    users.update(MENTION_PATTERN.findall("\n\0\n".join(texts)))
     
-    valid_users = set()
-    for u in users:
-        if u and u[0].isalpha():
-            # Skip if it looks like a hex string (commit SHA fragment)
-            if not hex_pattern.match(u.lower()):
-                # Skip if it's too short (likely not a real username)
-                if len(u) >= 2:
-                    valid_users.add(u)
+    # Validate first, one regex match per name, so the common-word difference
+    # below only hashes plausible usernames (commit SHAs and the like are gone)
+    users = {u for u in users if _VALID_USER_PATTERN.match(u)}
     
-    return valid_users
+    # Remove invalid usernames
+    users -= _COMMON_WORDS
+    return users
 
 
 def fetch_discussions(repo: str, token: Optional[str], week_start: datetime, week_end: datetime) -> List[Dict]:
@@ -828,25 +1249,13 @@ def fetch_discussions(repo: str, token: Optional[str], week_start: datetime, wee
     owner, name = repo.split("/")
     variables = {"owner": owner, "name": name}
 
-    url = "https://api.github.com/graphql"
-    response = requests.post(
-        url, json={"query": query, "variables": variables}, headers=headers
-    )
-
     discussions = []
-    if response.status_code == 403:
-        # Handle rate limiting
-        rate_limit_remaining = response.headers.get('X-RateLimit-Remaining')
-        if rate_limit_remaining == '0':
-            error(f"Rate limit exceeded when fetching discussions for {repo}")
-        else:
-            error(f"HTTP 403: Access forbidden for {repo} discussions. Check token permissions.")
-        return discussions
-    elif response.status_code != 200:
-        error(f"Error fetching discussions: {response.status_code}")
+    # Retried through rate limits and server errors like the other queries
+    result = fetch_graphql_data(query, variables, headers)
+    if not result:
+        error(f"Failed to fetch discussions for {repo}")
         return discussions
 
-    result = response.json()
     if (
         "data" in result
         and result["data"] is not None
@@ -854,9 +1263,14 @@ def fetch_discussions(repo: str, token: Optional[str], week_start: datetime, wee
         and result["data"]["repository"] is not None
         and "discussions" in result["data"]["repository"]
     ):
-        for discussion in result["data"]["repository"]["discussions"]["nodes"]:
-            # Check if discussion falls within our target week range
-            if not is_in_week_range(discussion["updatedAt"], week_start, week_end):
+        discussion_nodes = result["data"]["repository"]["discussions"]["nodes"]
+        
+        # Check which discussions fall within our target week range
+        in_week = filter_in_week_range(
+            [discussion["updatedAt"] for discussion in discussion_nodes], week_start, week_end
+        )
+        for discussion, discussion_in_week in zip(discussion_nodes, in_week):
+            if not discussion_in_week:
                 continue
             
             discussions.append(
@@ -1,38 +1,75 @@
 """Rich console logging utilities."""
 
+import logging
+import os
+
 from rich.console import Console
+from rich.logging import RichHandler
+from rich.style import Style
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any
 
 # Global console instance
 console = Console()
 
+# Verbose diagnostics (such as per-page API progress) are logged with the
+# standard logging module under "ruminant", and shown on the console when
+# RUMINANT_LOG names a level (e.g. RUMINANT_LOG=DEBUG)
+_log_level = logging.getLevelName(os.environ.get("RUMINANT_LOG", "").upper())
+if isinstance(_log_level, int):
+    _logger = logging.getLogger("ruminant")
+    _logger.setLevel(_log_level)
+    _logger.addHandler(RichHandler(console=console, show_path=False))
+
+
+def _printer(prefix: str, style: str) -> Callable[[str], None]:
+    """Build a function printing messages with a fixed prefix and style.
+    
+    The style is parsed once, and messages are printed as literal text with
+    the console's usual highlighting rather than re-parsed as markup (so a
+    name like "dependabot[bot]" is printed as is).
+    """
+    parsed_style = Style.parse(style)
+    highlighter = console.highlighter
+    
+    def print_message(message: str) -> None:
+        console.print(highlighter(Text(prefix + message, style=parsed_style)))
+    
+    return print_message
+
+
+_print_success = _printer("✅ ", "")
+_print_error = _printer("❌ ", "red")
+_print_warning = _printer("⚠️  ", "yellow")
+_print_info = _printer("ℹ️  ", "blue")
+_print_step = _printer("📥 ", "cyan")
+
 
 def success(message: str) -> None:
     """Print a success message."""
-    console.print(f"✅ {message}")
+    _print_success(message)
 
 
 def error(message: str) -> None:
     """Print an error message."""
-    console.print(f"❌ {message}", style="red")
+    _print_error(message)
 
 
 def warning(message: str) -> None:
     """Print a warning message."""
-    console.print(f"⚠️  {message}", style="yellow")
+    _print_warning(message)
 
 
 def info(message: str) -> None:
     """Print an info message."""
-    console.print(f"ℹ️  {message}", style="blue")
+    _print_info(message)
 
 
 def step(message: str) -> None:
     """Print a step message."""
-    console.print(f"📥 {message}", style="cyan")
+    _print_step(message)
 
 
 def summary_table(title: str, results: List[Dict[str, Any]]) -> None:
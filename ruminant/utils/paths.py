@@ -1,159 +1,266 @@
 """Path utilities for ruminant data directories."""
 
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple
+from typing import Iterable, NamedTuple, Tuple
+
+# Data directories as plain strings; file paths are joined from these with a
+# single os.path.join and wrapped in a Path once
+_DATA = "data"
+_GH = os.path.join(_DATA, "gh")
+_PROMPTS = os.path.join(_DATA, "prompts")
+_SUMMARIES = os.path.join(_DATA, "summaries")
+_REPORTS = os.path.join(_DATA, "reports")
+_LOGS = os.path.join(_DATA, "logs")
+_GROUPS = os.path.join(_DATA, "groups")
+
+# The data root itself, built once
+_DATA_ROOT = Path(_DATA)
 
 
 def get_data_dir() -> Path:
     """Get the data directory path."""
-    return Path("data")
+    return _DATA_ROOT
 
 
+# Directory getters are memoized: Path objects are immutable, so the same
+# instance is handed out on every call instead of rebuilding the chain
+@lru_cache(maxsize=1)
 def get_gh_cache_dir() -> Path:
     """Get the GitHub cache directory path."""
-    return get_data_dir() / "gh"
+    return Path(_GH)
 
 
+@lru_cache(maxsize=1)
 def get_prompts_dir() -> Path:
     """Get the prompts directory path."""
-    return get_data_dir() / "prompts"
+    return Path(_PROMPTS)
 
 
+@lru_cache(maxsize=1)
 def get_summaries_dir() -> Path:
     """Get the summaries directory path."""
-    return get_data_dir() / "summaries"
+    return Path(_SUMMARIES)
 
 
+@lru_cache(maxsize=1)
 def get_reports_dir() -> Path:
     """Get the reports directory path."""
-    return get_data_dir() / "reports"
+    return Path(_REPORTS)
 
 
+@lru_cache(maxsize=1)
 def get_logs_dir() -> Path:
     """Get the logs directory path."""
-    return get_data_dir() / "logs"
+    return Path(_LOGS)
 
 
+@lru_cache(maxsize=1)
 def get_groups_dir() -> Path:
     """Get the groups directory path."""
-    return get_data_dir() / "groups"
+    return Path(_GROUPS)
+
+
+class RepoDirs(NamedTuple):
+    """The data directories for one repository."""
+    cache: Path
+    prompts: Path
+    summaries: Path
+    reports: Path
+    logs: Path
+
+
+class GroupDirs(NamedTuple):
+    """The data directories for one group."""
+    prompts: Path
+    summaries: Path
+    reports: Path
+    logs: Path
+
+
+@lru_cache(maxsize=256)
+def repo_dirs(repo: str) -> RepoDirs:
+    """Get all data directories for a specific repository."""
+    owner, name = parse_repo(repo)
+    return RepoDirs(
+        cache=Path(os.path.join(_GH, owner, name)),
+        prompts=Path(os.path.join(_PROMPTS, owner, name)),
+        summaries=Path(os.path.join(_SUMMARIES, owner, name)),
+        reports=Path(os.path.join(_REPORTS, owner, name)),
+        logs=Path(os.path.join(_LOGS, owner, name)),
+    )
+
+
+@lru_cache(maxsize=256)
+def group_dirs(group: str) -> GroupDirs:
+    """Get all data directories for a specific group."""
+    return GroupDirs(
+        prompts=Path(os.path.join(_PROMPTS, "groups", group)),
+        summaries=Path(os.path.join(_SUMMARIES, "groups", group)),
+        reports=Path(os.path.join(_REPORTS, "groups", group)),
+        logs=Path(os.path.join(_LOGS, "groups", group)),
+    )
 
 
 def get_group_prompts_dir(group: str) -> Path:
     """Get the prompts directory for a specific group."""
-    return get_prompts_dir() / "groups" / group
+    return group_dirs(group).prompts
 
 
 def get_group_summaries_dir(group: str) -> Path:
     """Get the summaries directory for a specific group."""
-    return get_summaries_dir() / "groups" / group
+    return group_dirs(group).summaries
 
 
 def get_group_reports_dir(group: str) -> Path:
     """Get the reports directory for a specific group."""
-    return get_reports_dir() / "groups" / group
+    return group_dirs(group).reports
 
 
 def get_repo_cache_dir(repo: str) -> Path:
     """Get the cache directory for a specific repository."""
-    owner, name = repo.split("/")
-    return get_gh_cache_dir() / owner / name
+    return repo_dirs(repo).cache
 
 
 def get_repo_prompts_dir(repo: str) -> Path:
     """Get the prompts directory for a specific repository."""
-    owner, name = repo.split("/")
-    return get_prompts_dir() / owner / name
+    return repo_dirs(repo).prompts
 
 
 def get_repo_summaries_dir(repo: str) -> Path:
     """Get the summaries directory for a specific repository."""
-    owner, name = repo.split("/")
-    return get_summaries_dir() / owner / name
+    return repo_dirs(repo).summaries
 
 
 def get_repo_reports_dir(repo: str) -> Path:
     """Get the reports directory for a specific repository."""
-    owner, name = repo.split("/")
-    return get_reports_dir() / owner / name
+    return repo_dirs(repo).reports
+
+
+@lru_cache(maxsize=256)
+def _week_stem(year: int, week: int) -> str:
+    """Get the "week-WW-YYYY" stem shared by a week's file names."""
+    return f"week-{week:02d}-{year}"
 
 
 def get_cache_file_path(repo: str, year: int, week: int) -> Path:
     """Get the cache file path for a specific repo and week."""
-    return get_repo_cache_dir(repo) / f"week-{week:02d}-{year}.json"
+    owner, name = parse_repo(repo)
+    return Path(os.path.join(_GH, owner, name, f"{_week_stem(year, week)}.json"))
 
 
 def get_prompt_file_path(repo: str, year: int, week: int) -> Path:
     """Get the prompt file path for a specific repo and week."""
-    return get_repo_prompts_dir(repo) / f"week-{week:02d}-{year}-prompt.txt"
+    owner, name = parse_repo(repo)
+    return Path(os.path.join(_PROMPTS, owner, name, f"{_week_stem(year, week)}-prompt.txt"))
 
 
 def get_summary_file_path(repo: str, year: int, week: int) -> Path:
     """Get the summary file path for a specific repo and week."""
-    return get_repo_summaries_dir(repo) / f"week-{week:02d}-{year}.json"
+    owner, name = parse_repo(repo)
+    return Path(os.path.join(_SUMMARIES, owner, name, f"{_week_stem(year, week)}.json"))
 
 
 def get_report_file_path(repo: str, year: int, week: int) -> Path:
     """Get the report file path for a specific repo and week."""
-    return get_repo_reports_dir(repo) / f"week-{week:02d}-{year}.json"
+    owner, name = parse_repo(repo)
+    return Path(os.path.join(_REPORTS, owner, name, f"{_week_stem(year, week)}.json"))
 
 
 def get_session_log_file_path(repo: str, year: int, week: int) -> Path:
     """Get the session log file path for a specific repo and week."""
-    owner, name = repo.split("/")
-    return get_logs_dir() / owner / name / f"week-{week:02d}-{year}-session.json"
+    owner, name = parse_repo(repo)
+    return Path(os.path.join(_LOGS, owner, name, f"{_week_stem(year, week)}-session.json"))
+
+
+# Directories already created by this process, so that ensuring them again
+# costs a set lookup rather than a stat of every ancestor
+_ensured = set()
+
+
+def _ensure(path: Path) -> None:
+    """Create a directory and its parents, once per process."""
+    if path in _ensured:
+        return
+    os.makedirs(path, exist_ok=True)
+    _ensured.add(path)
 
 
 def ensure_repo_dirs(repo: str) -> None:
     """Ensure all directories exist for a repository."""
-    get_repo_cache_dir(repo).mkdir(parents=True, exist_ok=True)
-    get_repo_prompts_dir(repo).mkdir(parents=True, exist_ok=True)
-    get_repo_summaries_dir(repo).mkdir(parents=True, exist_ok=True)
-    get_repo_reports_dir(repo).mkdir(parents=True, exist_ok=True)
-    # Ensure logs directory for this repo
-    owner, name = repo.split("/")
-    (get_logs_dir() / owner / name).mkdir(parents=True, exist_ok=True)
+    for path in repo_dirs(repo):
+        _ensure(path)
+
+
+def ensure_all_repo_dirs(repos: Iterable[str]) -> None:
+    """Ensure all directories exist for several repositories at once.
+    
+    Every directory needed, ancestors included, is collected first and then
+    created shallowest first with one mkdir each, so shared parents such as
+    data/gh/<owner> are only touched once. Malformed repository names are
+    skipped, leaving their errors to whoever handles that repository.
+    """
+    needed = set()
+    for repo in repos:
+        try:
+            dirs = repo_dirs(repo)
+        except ValueError:
+            continue
+        for path in dirs:
+            if path in _ensured:
+                continue
+            needed.add(path)
+            needed.update(path.parents[:-1])  # Skip the final "."
+    
+    for path in sorted(needed, key=lambda p: len(p.parts)):
+        if path in _ensured:
+            continue
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            pass
+        _ensured.add(path)
 
 
 def get_group_prompt_file_path(group: str, year: int, week: int) -> Path:
     """Get the group prompt file path for a specific group and week."""
-    return get_group_prompts_dir(group) / f"week-{week:02d}-{year}-prompt.txt"
+    return Path(os.path.join(_PROMPTS, "groups", group, f"{_week_stem(year, week)}-prompt.txt"))
 
 
 def get_group_summary_file_path(group: str, year: int, week: int) -> Path:
     """Get the group summary file path for a specific group and week."""
-    return get_group_summaries_dir(group) / f"week-{week:02d}-{year}.json"
+    return Path(os.path.join(_SUMMARIES, "groups", group, f"{_week_stem(year, week)}.json"))
 
 
 def get_group_report_file_path(group: str, year: int, week: int) -> Path:
     """Get the group report file path for a specific group and week."""
-    return get_group_reports_dir(group) / f"week-{week:02d}-{year}.json"
+    return Path(os.path.join(_REPORTS, "groups", group, f"{_week_stem(year, week)}.json"))
 
 
 def get_group_session_log_file_path(group: str, year: int, week: int) -> Path:
     """Get the group session log file path for a specific group and week."""
-    return get_logs_dir() / "groups" / group / f"week-{week:02d}-{year}-session.json"
+    return Path(os.path.join(_LOGS, "groups", group, f"{_week_stem(year, week)}-session.json"))
 
 
 def ensure_group_dirs(group: str) -> None:
     """Ensure all directories exist for a group."""
-    get_group_prompts_dir(group).mkdir(parents=True, exist_ok=True)
-    get_group_summaries_dir(group).mkdir(parents=True, exist_ok=True)
-    get_group_reports_dir(group).mkdir(parents=True, exist_ok=True)
-    (get_logs_dir() / "groups" / group).mkdir(parents=True, exist_ok=True)
+    for path in group_dirs(group):
+        _ensure(path)
 
 
+@lru_cache(maxsize=512)
 def parse_repo(repo: str) -> Tuple[str, str]:
     """Parse a repository string into owner and name."""
-    if "/" not in repo:
-        raise ValueError(f"Repository must be in format 'owner/name', got: {repo}")
-    
-    parts = repo.split("/")
-    if len(parts) != 2:
+    # One scan for the last separator; a missing one or a second one in the
+    # owner part means the string isn't owner/name
+    owner, sep, name = repo.rpartition("/")
+    if not sep or "/" in owner:
         raise ValueError(f"Repository must be in format 'owner/name', got: {repo}")
     
-    owner, name = parts
     if not owner or not name:
         raise ValueError(f"Repository owner and name cannot be empty, got: {repo}")
     
-    return owner, name
\ No newline at end of file
+    # Interned, so repositories sharing an owner share one owner string
+    return sys.intern(owner), sys.intern(name)
\ No newline at end of file